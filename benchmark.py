@@ -0,0 +1,310 @@
+"""NeuralNetwork performans ölçüm aracı
+
+Katman genişliği, derinlik, batch boyutu, aktivasyon ve loss fonksiyonu
+kombinasyonları için ileri/geri yayılım ve epoch sürelerini ölçer, sonuçları
+JSON olarak yazar ve isteğe bağlı olarak kayıtlı bir baseline ile karşılaştırır.
+
+Örnek:
+    python benchmark.py --output sonuc.json --baseline benchmark_baseline.json
+    python benchmark.py --save-baseline benchmark_baseline.json
+    python benchmark.py --kernels --kernel-size 1000000
+"""
+import argparse
+import itertools
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from network_functions import (ACTIVATION_FUNCTIONS, ELU_ALPHA, LEAKY_RELU_ALPHA, LOSS_FUNCTIONS, NeuralNetwork,
+                               supports_fused_output)
+
+DEFAULT_WIDTHS = [16, 64, 256]
+DEFAULT_DEPTHS = [1, 3]
+DEFAULT_BATCH_SIZES = [1, 32, 256]
+INPUT_COUNT = 16
+OUTPUT_COUNT = 4
+
+
+def case_name(case):
+    """Baseline karşılaştırmasında kullanılan benzersiz senaryo adı"""
+    name = f"w{case['width']}-d{case['depth']}-b{case['batch_size']}-{case['activation']}-{case['loss']}"
+    if case.get('mode', 'default') != 'default':
+        name += f"-{case['mode']}"
+    return name
+
+
+def build_network(case, seed=0):
+    """Senaryo için sabit tohumlu rastgele bir ağ ve veri oluştur"""
+    rng = np.random.default_rng(seed)
+    layer_sizes = [INPUT_COUNT] + [case['width']] * case['depth'] + [OUTPUT_COUNT]
+
+    weights = [
+        rng.normal(0, np.sqrt(2.0 / (n_in + n_out)), size=(n_out, n_in))
+        for n_in, n_out in zip(layer_sizes[:-1], layer_sizes[1:])
+    ]
+    biases = [np.zeros(n_out) for n_out in layer_sizes[1:]]
+
+    activation = ACTIVATION_FUNCTIONS[case['activation']]
+    loss_func, loss_derivative = LOSS_FUNCTIONS[case['loss']]
+    network = NeuralNetwork(
+        weights=weights,
+        biases=biases,
+        activation_func=activation,
+        activation_derivative=activation.derivative,
+        loss_func=loss_func,
+        loss_derivative=loss_derivative,
+        learning_rate=0.001,
+        use_workspace=case.get('mode') == 'workspace',
+        flat_parameters=case.get('mode') == 'flat',
+        fused_output=case.get('mode') == 'fused'
+    )
+
+    if case['batch_size'] == 1:
+        x = rng.normal(size=INPUT_COUNT)
+        y = rng.uniform(0.05, 0.95, size=OUTPUT_COUNT)
+    else:
+        x = rng.normal(size=(case['batch_size'], INPUT_COUNT))
+        y = rng.uniform(0.05, 0.95, size=(case['batch_size'], OUTPUT_COUNT))
+    return network, x, y
+
+
+def run_epoch(network, x, y, timings=None):
+    """Bir eğitim epoch'u (ileri yayılım + loss + geri yayılım)"""
+    start = time.perf_counter()
+    output = network.forward_propagation(x)
+    network.compute_loss(output, y)
+    middle = time.perf_counter()
+    network.backward_propagation(x, y)
+    end = time.perf_counter()
+
+    if timings is not None:
+        timings['forward'].append(middle - start)
+        timings['backward'].append(end - middle)
+        timings['epoch'].append(end - start)
+
+
+def measure_case(case, epochs, warmup, memory_epochs=5):
+    """Tek bir senaryonun süre, throughput ve bellek ölçümleri"""
+    network, x, y = build_network(case)
+    timings = {'forward': [], 'backward': [], 'epoch': []}
+
+    with np.errstate(all='ignore'):
+        for _ in range(warmup):
+            run_epoch(network, x, y)
+        for _ in range(epochs):
+            run_epoch(network, x, y, timings)
+
+        # tracemalloc süre ölçümünü bozduğundan bellek ayrı bir turda ölçülür
+        network, x, y = build_network(case)
+        tracemalloc.start()
+        for _ in range(memory_epochs):
+            run_epoch(network, x, y)
+        _, peak_bytes = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    epoch_times = np.array(timings['epoch'])
+    result = dict(case)
+    result.update({
+        'name': case_name(case),
+        'epochs': epochs,
+        'samples_per_second': case['batch_size'] / float(epoch_times.mean()),
+        'epoch_ms': {
+            'p50': float(np.percentile(epoch_times, 50) * 1e3),
+            'p90': float(np.percentile(epoch_times, 90) * 1e3),
+            'p99': float(np.percentile(epoch_times, 99) * 1e3)
+        },
+        'forward_ms_p50': float(np.median(timings['forward']) * 1e3),
+        'backward_ms_p50': float(np.median(timings['backward']) * 1e3),
+        'peak_memory_kb': peak_bytes / 1024
+    })
+    return result
+
+
+# Aktivasyon çekirdeklerinin önceki / doğrudan (naif) gerçeklemeleri; --kernels
+# ölçümünde güncel çekirdeklerle karşılaştırılır
+REFERENCE_KERNELS = {
+    "Sigmoid": lambda x: 1 / (1 + np.exp(-x)),
+    "Tanh": lambda x: (np.exp(x) - np.exp(-x)) / (np.exp(x) + np.exp(-x)),
+    "Leaky ReLU": lambda x: np.where(x > 0, x, LEAKY_RELU_ALPHA * x),
+    "ELU": lambda x: np.where(x > 0, x, ELU_ALPHA * (np.exp(x) - 1)),
+    "Softmax": lambda x: np.exp(x - np.max(x, axis=-1, keepdims=True)) /
+    np.sum(np.exp(x - np.max(x, axis=-1, keepdims=True)), axis=-1, keepdims=True)
+}
+KERNEL_COLUMNS = 64
+
+
+def best_time(function, repeats):
+    """repeats çalıştırmanın en kısa süresi (saniye)"""
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def measure_kernels(size, repeats):
+    """Her aktivasyonun ileri ve geri yayılım çekirdeğini ölç
+
+    Güncel çekirdekler önceden ayrılmış `out` tamponlarıyla (workspace modundaki
+    gibi) çağrılır; referans gerçeklemeler her çağrıda yeni dizi ayırır.
+    Girişler taşma davranışını da kapsayacak şekilde geniş bir aralıktan seçilir.
+    """
+    rng = np.random.default_rng(0)
+    z = rng.normal(0, 10, size=(max(size // KERNEL_COLUMNS, 1), KERNEL_COLUMNS))
+    grad = rng.normal(size=z.shape)
+    out = np.empty_like(z)
+    results = []
+    with np.errstate(all='ignore'):
+        for name, activation in ACTIVATION_FUNCTIONS.items():
+            a = activation(z)
+            result = {
+                'activation': name,
+                'size': z.size,
+                'forward_ms': best_time(lambda: activation(z, out=out), repeats) * 1e3,
+                'backward_ms': best_time(lambda: activation.backward(grad, z, a, out=out), repeats) * 1e3
+            }
+            reference = REFERENCE_KERNELS.get(name)
+            if reference is not None:
+                result['reference_forward_ms'] = best_time(lambda: reference(z), repeats) * 1e3
+                result['speedup'] = result['reference_forward_ms'] / result['forward_ms']
+            results.append(result)
+    return results
+
+
+def print_kernel_results(results):
+    header = f"{'Aktivasyon':<16}{'ileri ms':>12}{'geri ms':>12}{'referans ms':>14}{'hızlanma':>10}"
+    print(header)
+    print("-" * len(header))
+    for result in results:
+        reference = f"{result['reference_forward_ms']:>14.3f}{result['speedup']:>9.2f}x" \
+            if 'reference_forward_ms' in result else f"{'-':>14}{'-':>10}"
+        print(f"{result['activation']:<16}{result['forward_ms']:>12.3f}{result['backward_ms']:>12.3f}{reference}")
+
+
+def build_cases(widths, depths, batch_sizes, activations, losses, modes):
+    return [
+        {
+            'width': width,
+            'depth': depth,
+            'batch_size': batch_size,
+            'activation': activation,
+            'loss': loss,
+            'mode': mode
+        }
+        for width, depth, batch_size, activation, loss, mode in itertools.product(
+            widths, depths, batch_sizes, activations, losses, modes
+        )
+        # Birleşik çıkış katmanı yalnızca belirli aktivasyon/loss eşleşmelerinde tanımlıdır
+        if mode != 'fused' or supports_fused_output(activation, loss)
+    ]
+
+
+def compare_with_baseline(results, baseline, tolerance, min_delta_ms=0.05):
+    """Baseline'a göre epoch p50 süresi tolerance'tan fazla artan senaryoları döndür
+
+    Çok küçük senaryolarda ölçüm gürültüsünü elemek için min_delta_ms'den
+    küçük mutlak farklar yok sayılır.
+    """
+    baseline_by_name = {result['name']: result for result in baseline['results']}
+    regressions = []
+    for result in results:
+        reference = baseline_by_name.get(result['name'])
+        if reference is None:
+            continue
+        ratio = result['epoch_ms']['p50'] / reference['epoch_ms']['p50']
+        delta_ms = result['epoch_ms']['p50'] - reference['epoch_ms']['p50']
+        if ratio > 1 + tolerance and delta_ms > min_delta_ms:
+            regressions.append((result['name'], reference['epoch_ms']['p50'], result['epoch_ms']['p50'], ratio))
+    return regressions
+
+
+def print_results(results):
+    header = f"{'Senaryo':<48}{'örnek/s':>12}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}{'bellek KB':>12}"
+    print(header)
+    print("-" * len(header))
+    for result in results:
+        print(
+            f"{result['name']:<48}{result['samples_per_second']:>12.0f}"
+            f"{result['epoch_ms']['p50']:>10.3f}{result['epoch_ms']['p90']:>10.3f}"
+            f"{result['epoch_ms']['p99']:>10.3f}{result['peak_memory_kb']:>12.1f}"
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="NeuralNetwork performans ölçümü")
+    parser.add_argument("--widths", type=int, nargs="+", default=DEFAULT_WIDTHS)
+    parser.add_argument("--depths", type=int, nargs="+", default=DEFAULT_DEPTHS,
+                        help="Gizli katman sayıları")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=DEFAULT_BATCH_SIZES)
+    parser.add_argument("--activations", nargs="+", default=list(ACTIVATION_FUNCTIONS.keys()),
+                        choices=list(ACTIVATION_FUNCTIONS.keys()))
+    parser.add_argument("--losses", nargs="+", default=list(LOSS_FUNCTIONS.keys()),
+                        choices=list(LOSS_FUNCTIONS.keys()))
+    parser.add_argument("--modes", nargs="+", default=["default"], choices=["default", "workspace", "flat", "fused"],
+                        help="NeuralNetwork çalışma modları")
+    parser.add_argument("--epochs", type=int, default=50, help="Ölçülen epoch sayısı")
+    parser.add_argument("--warmup", type=int, default=5, help="Ölçüm öncesi ısınma epoch sayısı")
+    parser.add_argument("--output", help="Sonuçların yazılacağı JSON dosyası")
+    parser.add_argument("--baseline", help="Karşılaştırılacak baseline JSON dosyası")
+    parser.add_argument("--save-baseline", help="Sonuçları yeni baseline olarak kaydet")
+    parser.add_argument("--tolerance", type=float, default=0.15,
+                        help="Baseline'a göre kabul edilen göreli yavaşlama (varsayılan %%15)")
+    parser.add_argument("--min-delta-ms", type=float, default=0.05,
+                        help="Bundan küçük mutlak yavaşlamalar yok sayılır (ms)")
+    parser.add_argument("--kernels", action="store_true",
+                        help="Ağ yerine yalnızca aktivasyon çekirdeklerini referans gerçeklemelerle karşılaştır")
+    parser.add_argument("--kernel-size", type=int, default=1_000_000, help="Çekirdek ölçümündeki eleman sayısı")
+    args = parser.parse_args(argv)
+
+    meta = {
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'machine': platform.machine(),
+        'platform': platform.platform(),
+        'timestamp': time.strftime("%Y-%m-%dT%H:%M:%S")
+    }
+
+    if args.kernels:
+        kernels = measure_kernels(args.kernel_size, args.epochs)
+        print_kernel_results(kernels)
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                json.dump({'meta': meta, 'kernels': kernels}, f, indent=2)
+        return 0
+
+    cases = build_cases(args.widths, args.depths, args.batch_sizes, args.activations, args.losses, args.modes)
+    results = [measure_case(case, args.epochs, args.warmup) for case in cases]
+
+    report = {
+        'meta': meta,
+        'results': results
+    }
+
+    print_results(results)
+
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare_with_baseline(results, baseline, args.tolerance, args.min_delta_ms)
+        if regressions:
+            print(f"\n{len(regressions)} senaryoda yavaşlama tespit edildi:")
+            for name, reference, current, ratio in regressions:
+                print(f"  {name}: {reference:.3f} ms -> {current:.3f} ms ({ratio:.2f}x)")
+            return 1
+        print("\nBaseline'a göre yavaşlama tespit edilmedi.")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,264 @@
+"""Arayüzsüz (headless) eğitim ve tahmin aracı
+
+Tk, ttkbootstrap veya matplotlib gerektirmez; ekransız sunucularda toplu
+eğitim işleri için kullanılır.
+
+Örnekler:
+    python cli.py train --layers 3 8 2 --seed 42 --data veri.csv \\
+        --activation Sigmoid --loss "Mean Square Error" --epochs 500 --lr 0.1 \\
+        --output model.json --history loss.csv
+    python cli.py train --params model.json --data veri.npy --epochs 100 --output model2.json
+    python cli.py predict --params model.json --data girisler.csv --output tahminler.csv
+"""
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from dataset import StreamingDataset
+from network_functions import (ACTIVATION_FUNCTIONS, DEFAULT_DTYPE, DTYPES, LOSS_FUNCTIONS, NeuralNetwork,
+                               layer_sizes_from_weights)
+from network_io import load_network_parameters, save_network_parameters
+from inference import InferenceEngine
+from initializers import DEFAULT_INITIALIZER, INITIALIZERS, random_parameters
+from stopping import StoppingCriteria
+from optimizers import OPTIMIZERS
+from schedules import SCHEDULES
+
+
+def load_or_create_parameters(args):
+    if args.params:
+        network_parameters = load_network_parameters(args.params)
+        if args.layers and args.layers != network_parameters['layer_sizes']:
+            raise ValueError(
+                f"--layers {args.layers} parametre dosyasındaki yapı ile uyumsuz: "
+                f"{network_parameters['layer_sizes']}"
+            )
+        # --dtype verilirse yüklenen parametreler o hassasiyetle eğitilir ve kaydedilir
+        if args.dtype is not None:
+            network_parameters['dtype'] = args.dtype
+        return network_parameters
+
+    if not args.layers or len(args.layers) < 2:
+        raise ValueError("--params verilmediğinde --layers en az iki katman boyutu içermelidir")
+    return random_parameters(args.layers, args.init, args.seed, args.dtype or DEFAULT_DTYPE)
+
+
+def resolve_activation_name(args, network_parameters):
+    """Tahminde kullanılacak aktivasyon: manifestteki ad, yoksa --activation
+
+    Manifestte kayıtlı ad ile --activation çelişirse hata verilir; ağ başka bir
+    aktivasyonla eğitildiyse tahminler sessizce yanlış olurdu.
+    """
+    saved_name = network_parameters.get('activation')
+    if saved_name is None:
+        if args.activation is None:
+            raise ValueError("Parametre dosyasında aktivasyon kayıtlı değil; --activation verilmelidir")
+        return args.activation
+    if args.activation is not None and args.activation != saved_name:
+        raise ValueError(
+            f"--activation {args.activation} parametre dosyasındaki aktivasyon ile uyumsuz: {saved_name}"
+        )
+    return saved_name
+
+
+def write_history(path, loss_history, max_points=0):
+    """Loss geçmişini CSV olarak yaz; max_points > 0 ise eğri LTTB ile o kadar noktaya indirgenir"""
+    if max_points > 0:
+        epochs, losses = loss_history.downsample(max_points)
+    else:
+        epochs, losses = np.arange(len(loss_history)), loss_history.values
+
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("epoch,loss\n")
+        for epoch, loss in zip(epochs, losses):
+            f.write(f"{epoch + 1},{loss:.10g}\n")
+
+
+def command_train(args):
+    network_parameters = load_or_create_parameters(args)
+    layer_sizes = layer_sizes_from_weights(network_parameters['weights'])
+    dtype = DTYPES[network_parameters['dtype']]
+
+    # Verilmeyen fonksiyonlar başlangıç dosyasından, o da yoksa varsayılandan alınır
+    activation_name = (args.activation or network_parameters.get('activation')
+                       or list(ACTIVATION_FUNCTIONS.keys())[0])
+    loss_name = args.loss or network_parameters.get('loss') or list(LOSS_FUNCTIONS.keys())[0]
+    activation = ACTIVATION_FUNCTIONS[activation_name]
+    loss_func, loss_derivative = LOSS_FUNCTIONS[loss_name]
+
+    network = NeuralNetwork(
+        weights=[np.array(weight) for weight in network_parameters['weights']],
+        biases=[np.array(bias) for bias in network_parameters['biases']],
+        activation_func=activation,
+        activation_derivative=activation.derivative,
+        loss_func=loss_func,
+        loss_derivative=loss_derivative,
+        learning_rate=args.lr,
+        dtype=dtype,
+        use_workspace=args.workspace,
+        optimizer=OPTIMIZERS[args.optimizer](),
+        fused_output=args.fused_output
+    )
+
+    dataset = StreamingDataset(
+        args.data,
+        input_count=layer_sizes[0],
+        output_count=layer_sizes[-1],
+        chunk_size=args.chunk_size,
+        dtype=dtype,
+        skip_header=args.skip_header
+    )
+
+    stopping = StoppingCriteria(
+        tolerance=args.tolerance,
+        relative_tolerance=args.rel_tolerance,
+        patience=args.patience,
+        time_budget=args.time_budget,
+        divergence_factor=args.divergence_factor,
+        divergence_floor=args.divergence_floor
+    )
+
+    report_interval = max(1, args.epochs // 10)
+
+    def report_epoch(epoch, loss, learning_rate):
+        if epoch % report_interval == 0 or epoch == args.epochs - 1 or network.stop_reason is not None:
+            print(f"Epoch {epoch + 1}/{args.epochs} - loss: {loss:.6f} - lr: {learning_rate:.4g}")
+
+    start = time.perf_counter()
+    loss_history = network.train_stream(
+        dataset,
+        args.epochs,
+        stopping=stopping,
+        schedule=SCHEDULES[args.lr_schedule](),
+        callback=report_epoch if args.verbose else None
+    )
+    elapsed = time.perf_counter() - start
+    stop_reason = network.stop_reason
+
+    if stopping.diverged:
+        raise ValueError(f"{stop_reason}. Parametreler kaydedilmedi; daha küçük bir learning rate deneyin")
+
+    network_parameters = {
+        'inputs': np.array(network_parameters['inputs']),
+        'biases': network.biases,
+        'weights': network.weights,
+        'dtype': network_parameters['dtype'],
+        'activation': activation_name,
+        'loss': loss_name
+    }
+    save_network_parameters(args.output, network_parameters)
+    if args.history:
+        write_history(args.history, loss_history, args.history_points)
+
+    print(f"Eğitim tamamlandı: {len(loss_history)} epoch, {elapsed:.2f} s, son loss: {loss_history[-1]:.6f}")
+    if stop_reason is not None:
+        print(f"Erken durduruldu: {stop_reason}")
+    print(f"Parametreler kaydedildi: {args.output}")
+    return 0
+
+
+def command_predict(args):
+    network_parameters = load_network_parameters(args.params)
+    layer_sizes = network_parameters['layer_sizes']
+    dtype = DTYPES[network_parameters['dtype']]
+    activation = ACTIVATION_FUNCTIONS[resolve_activation_name(args, network_parameters)]
+
+    # Tahmin dosyasında yalnızca giriş sütunları bulunur
+    dataset = StreamingDataset(
+        args.data,
+        input_count=layer_sizes[0],
+        output_count=0,
+        chunk_size=args.chunk_size,
+        dtype=dtype,
+        skip_header=args.skip_header
+    )
+
+    # Çıkış tamponları parça boyutu başına bir kez ayrılır ve her parçada yeniden kullanılır
+    engine = InferenceEngine.from_parameters(network_parameters, activation)
+    with open(args.output, "w", encoding="utf-8") as f:
+        f.write(",".join(f"y{i + 1}" for i in range(layer_sizes[-1])) + "\n")
+        for x, _ in dataset:
+            np.savetxt(f, engine.predict(x), delimiter=",", fmt="%.10g")
+
+    print(f"Tahminler kaydedildi: {args.output}")
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Yapay sinir ağı eğitim ve tahmin aracı (arayüzsüz)")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    def add_data_arguments(subparser):
+        subparser.add_argument("--data", required=True,
+                               help="CSV veya .npy veri dosyası (giriş sütunları + gerçek çıkış sütunları)")
+        subparser.add_argument("--chunk-size", type=int, default=1024, help="Parça (mini-batch) boyutu")
+        subparser.add_argument("--skip-header", type=int, default=0, help="CSV başında atlanacak satır sayısı")
+        subparser.add_argument("--activation", choices=list(ACTIVATION_FUNCTIONS.keys()),
+                               help="Aktivasyon fonksiyonu (varsayılan: parametre dosyasında kayıtlı olan)")
+
+    train_parser = subparsers.add_parser("train", help="Ağı eğit ve parametreleri kaydet")
+    train_parser.add_argument("--layers", type=int, nargs="+",
+                              help="Katman boyutları, ör. 3 8 2 (giriş, gizli..., çıkış)")
+    train_parser.add_argument("--params", help="Başlangıç parametre dosyası (.json)")
+    train_parser.add_argument("--seed", type=int, help="Rastgele başlangıç için tohum")
+    train_parser.add_argument("--dtype", choices=list(DTYPES.keys()),
+                              help=f"Eğitim hassasiyeti (varsayılan: parametre dosyasındaki, yoksa {DEFAULT_DTYPE})")
+    train_parser.add_argument("--init", default=DEFAULT_INITIALIZER, choices=list(INITIALIZERS.keys()),
+                              help="Rastgele başlangıç yöntemi")
+    add_data_arguments(train_parser)
+    train_parser.add_argument("--loss", choices=list(LOSS_FUNCTIONS.keys()),
+                              help="Loss fonksiyonu (varsayılan: parametre dosyasında kayıtlı olan)")
+    train_parser.add_argument("--epochs", type=int, default=100)
+    train_parser.add_argument("--lr", type=float, default=0.01, help="Learning rate")
+    train_parser.add_argument("--optimizer", default="SGD", choices=list(OPTIMIZERS.keys()))
+    train_parser.add_argument("--lr-schedule", default="Constant", choices=list(SCHEDULES.keys()),
+                              help="Learning rate planı (parametreleri epoch sayısına göre ölçeklenir)")
+    train_parser.add_argument("--fused-output", action="store_true",
+                              help="Sigmoid + Cross Entropy / Softmax + Categorical Cross Entropy için birleşik çıkış katmanı")
+    train_parser.add_argument("--workspace", action="store_true",
+                              help="Önceden ayrılmış tamponlarla eğit (büyük parça boyutlarında hızlıdır)")
+    train_parser.add_argument("--tolerance", type=float, help="Loss bu değere inince dur")
+    train_parser.add_argument("--rel-tolerance", type=float,
+                              help="En iyi loss'a göre bu orandan küçük iyileşmeleri yok say")
+    train_parser.add_argument("--patience", type=int, help="Bu kadar epoch iyileşme olmazsa dur")
+    train_parser.add_argument("--time-budget", type=float, help="En uzun eğitim süresi (s)")
+    train_parser.add_argument("--divergence-factor", type=float, default=1e3,
+                              help="Loss ilk değerinin (en az --divergence-floor) bu katını aşarsa ıraksama say ve dur")
+    train_parser.add_argument("--divergence-floor", type=float, default=1e-3,
+                              help="Iraksama eşiğindeki en küçük referans loss")
+    train_parser.add_argument("--output", required=True, help="Eğitilmiş parametrelerin yazılacağı .json dosyası")
+    train_parser.add_argument("--history", help="Loss geçmişinin yazılacağı CSV dosyası")
+    train_parser.add_argument("--history-points", type=int, default=0,
+                              help="Loss geçmişini eğrinin şeklini koruyarak bu kadar noktaya indirge (0: tümü)")
+    train_parser.add_argument("--verbose", action="store_true")
+    train_parser.set_defaults(func=command_train)
+
+    predict_parser = subparsers.add_parser("predict", help="Kayıtlı ağ ile tahmin yap")
+    predict_parser.add_argument("--params", required=True, help="Parametre dosyası (.json)")
+    add_data_arguments(predict_parser)
+    predict_parser.add_argument("--output", required=True, help="Tahminlerin yazılacağı CSV dosyası")
+    predict_parser.set_defaults(func=command_predict)
+
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if getattr(args, "epochs", 1) <= 0:
+        parser.error("Epoch sayısı pozitif bir tam sayı olmalıdır")
+    if getattr(args, "lr", 1) <= 0:
+        parser.error("Learning rate pozitif bir sayı olmalıdır")
+
+    try:
+        return args.func(args)
+    except (OSError, ValueError) as e:
+        print(f"Hata: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+import itertools
+import os
+import queue
+import threading
+
+import numpy as np
+
+# Veri dosyalarında her satır bir örnektir: ilk input_count sütun giriş
+# değerleri, kalan sütunlar gerçek (hedef) çıkış değerleridir.
+
+
+def iter_csv_chunks(path, input_count, chunk_size, dtype=np.float64, delimiter=",", skip_header=0):
+    """CSV dosyasını chunk_size satırlık (x, y) parçaları halinde oku"""
+    with open(path, "r", encoding="utf-8") as f:
+        for _ in range(skip_header):
+            next(f, None)
+
+        while True:
+            lines = list(itertools.islice(f, chunk_size))
+            if not lines:
+                return
+            data = np.loadtxt(lines, delimiter=delimiter, dtype=dtype, ndmin=2)
+            if data.shape[0] == 0:
+                continue
+            yield data[:, :input_count], data[:, input_count:]
+
+
+def iter_npy_chunks(path, input_count, chunk_size, dtype=np.float64):
+    """2-D .npy dosyasını belleğe eşleyerek (x, y) parçaları halinde oku
+
+    Yalnızca o anki parça belleğe kopyalanır.
+    """
+    data = np.load(path, mmap_mode="r")
+    if data.ndim != 2:
+        raise ValueError(f"Veri dosyası 2 boyutlu olmalıdır, bulunan: {data.ndim}")
+
+    for start in range(0, data.shape[0], chunk_size):
+        chunk = np.array(data[start:start + chunk_size], dtype=dtype)
+        yield chunk[:, :input_count], chunk[:, input_count:]
+
+
+def prefetch(chunks, depth=2):
+    """Parçaları arka plan thread'inde önceden oku
+
+    Tüketici bir parçayı işlerken sonraki en fazla `depth` parça hazırlanır.
+    Üretici tarafında oluşan hata tüketici tarafında yeniden fırlatılır.
+    """
+    buffer = queue.Queue(maxsize=depth)
+    stop_event = threading.Event()
+    finished = object()
+
+    def put(item):
+        while not stop_event.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def producer():
+        try:
+            for chunk in chunks:
+                if not put(chunk):
+                    return
+        except Exception as e:
+            put(e)
+            return
+        put(finished)
+
+    thread = threading.Thread(target=producer, daemon=True)
+    thread.start()
+
+    try:
+        while True:
+            item = buffer.get()
+            if item is finished:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stop_event.set()
+
+
+class StreamingDataset:
+    """Bellekten büyük CSV / .npy veri setleri için parça parça okuyucu
+
+    Her iterasyon (her epoch) dosyayı baştan okur ve (x, y) parçaları üretir.
+    prefetch_depth > 0 ise sonraki parçalar arka planda önceden okunur.
+    """
+
+    def __init__(self, path, input_count, output_count=None, chunk_size=1024, dtype=np.float64,
+                 prefetch_depth=2, delimiter=",", skip_header=0):
+        if chunk_size <= 0:
+            raise ValueError("Parça boyutu pozitif bir tam sayı olmalıdır")
+
+        self.path = path
+        self.input_count = input_count
+        self.output_count = output_count
+        self.chunk_size = chunk_size
+        self.dtype = np.dtype(dtype)
+        self.prefetch_depth = prefetch_depth
+        self.delimiter = delimiter
+        self.skip_header = skip_header
+
+    def iter_chunks(self):
+        """Dosyayı önbellek kullanmadan parça parça oku"""
+        if os.path.splitext(self.path)[1].lower() == ".npy":
+            chunks = iter_npy_chunks(self.path, self.input_count, self.chunk_size, self.dtype)
+        else:
+            chunks = iter_csv_chunks(self.path, self.input_count, self.chunk_size, self.dtype,
+                                     self.delimiter, self.skip_header)
+
+        for x, y in chunks:
+            if x.shape[1] != self.input_count or (self.output_count is not None and y.shape[1] != self.output_count):
+                expected = self.input_count + (self.output_count or 0)
+                raise ValueError(
+                    f"Veri setinde satır başına {expected} sütun bekleniyordu, "
+                    f"bulunan: {x.shape[1] + y.shape[1]}"
+                )
+            yield x, y
+
+    def __iter__(self):
+        if self.prefetch_depth > 0:
+            return prefetch(self.iter_chunks(), self.prefetch_depth)
+        return self.iter_chunks()
@@ -0,0 +1,198 @@
+import itertools
+import math
+import queue
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, CancelledError, ProcessPoolExecutor, wait
+
+import numpy as np
+
+from network_functions import ACTIVATION_FUNCTIONS, LOSS_FUNCTIONS, LossFunctions, NeuralNetwork, parameter_dtype
+from optimizers import OPTIMIZERS
+
+# Sonuç beklenirken iptal kontrolünün aralığı (s)
+CANCEL_POLL_INTERVAL = 0.2
+
+
+def build_grid(learning_rates, epoch_counts, activation_names=None, loss_names=None, optimizer_names=None):
+    """Tüm hiperparametre kombinasyonlarını üret
+
+    activation_names / loss_names / optimizer_names verilmezse ACTIVATION_FUNCTIONS,
+    LOSS_FUNCTIONS ve OPTIMIZERS içindeki tüm anahtarlar kullanılır.
+    """
+    if activation_names is None:
+        activation_names = list(ACTIVATION_FUNCTIONS.keys())
+    if loss_names is None:
+        loss_names = list(LOSS_FUNCTIONS.keys())
+    if optimizer_names is None:
+        optimizer_names = list(OPTIMIZERS.keys())
+
+    return [
+        {
+            'activation': activation_name,
+            'loss': loss_name,
+            'optimizer': optimizer_name,
+            'learning_rate': float(learning_rate),
+            'epochs': int(epochs)
+        }
+        for activation_name, loss_name, optimizer_name, learning_rate, epochs in itertools.product(
+            activation_names, loss_names, optimizer_names, learning_rates, epoch_counts
+        )
+    ]
+
+
+def train_combination(network_parameters, targets, combination):
+    """Tek bir kombinasyonu aynı başlangıç parametrelerinden eğit
+
+    Worker process içinde çalışır; bu yüzden yalnızca picklable değerler alır
+    ve döndürür.
+    """
+    activation = ACTIVATION_FUNCTIONS[combination['activation']]
+    loss_func, loss_derivative = LOSS_FUNCTIONS[combination['loss']]
+
+    network = NeuralNetwork(
+        weights=[weight.copy() for weight in network_parameters['weights']],
+        biases=[bias.copy() for bias in network_parameters['biases']],
+        activation_func=activation,
+        activation_derivative=activation.derivative,
+        loss_func=loss_func,
+        loss_derivative=loss_derivative,
+        learning_rate=combination['learning_rate'],
+        dtype=parameter_dtype(network_parameters),
+        optimizer=OPTIMIZERS[combination['optimizer']]()
+    )
+
+    start = time.perf_counter()
+    with np.errstate(all='ignore'):
+        network.train(network_parameters['inputs'], targets, combination['epochs'])
+        output = network.forward_propagation(network_parameters['inputs'])
+        final_loss = float(network.compute_loss(output, targets))
+        # Farklı loss fonksiyonlarının değerleri aynı ölçekte olmadığından sıralama,
+        # tüm kombinasyonlar için aynı olan son tahminlerin MSE'si ile yapılır
+        mse = float(LossFunctions.mse(output, targets))
+    wall_time = time.perf_counter() - start
+
+    result = dict(combination)
+    result['final_loss'] = final_loss
+    result['mse'] = mse
+    result['wall_time'] = wall_time
+    return result
+
+
+def rank_results(results):
+    """Sonuçları ortak ölçüte (son tahminlerin MSE'si) göre sırala (NaN/inf en sona)
+
+    final_loss her kombinasyonun kendi loss fonksiyonuyla hesaplandığından
+    farklı loss fonksiyonları arasında karşılaştırılamaz; yalnızca bilgi amaçlıdır.
+    """
+    def key(result):
+        loss = result['mse']
+        return (not math.isfinite(loss), loss if math.isfinite(loss) else 0.0, result['wall_time'])
+
+    ranked = sorted(results, key=key)
+    for rank, result in enumerate(ranked, start=1):
+        result['rank'] = rank
+    return ranked
+
+
+def run_sweep(network_parameters, targets, learning_rates, epoch_counts, activation_names=None,
+              loss_names=None, optimizer_names=None, max_workers=None, progress_callback=None, executor=None):
+    """Hiperparametre taramasını ProcessPoolExecutor üzerinde çalıştır
+
+    Her kombinasyon aynı network_parameters kopyasından başlar. Sonuçlar
+    son tahminlerin MSE'sine göre sıralanmış sözlük listesi olarak döner.
+
+    executor verilirse (ör. SweepWorker'ın iptal edebildiği havuz) kombinasyonlar
+    onda çalıştırılır ve kapatılması çağırana bırakılır; havuz iptal edilirse
+    CancelledError fırlatılır.
+    """
+    grid = build_grid(learning_rates, epoch_counts, activation_names, loss_names, optimizer_names)
+    targets = np.asarray(targets, dtype=parameter_dtype(network_parameters))
+
+    owns_executor = executor is None
+    if owns_executor:
+        executor = ProcessPoolExecutor(max_workers=max_workers)
+    results = []
+    try:
+        futures = [
+            executor.submit(train_combination, network_parameters, targets, combination)
+            for combination in grid
+        ]
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, timeout=CANCEL_POLL_INTERVAL, return_when=FIRST_COMPLETED)
+            for future in done:
+                results.append(future.result())
+                if progress_callback is not None:
+                    progress_callback(len(results), len(grid))
+            # shutdown(cancel_futures=True) ile iptal edilen görevler bekleyenleri uyandırmaz
+            if any(future.cancelled() for future in pending):
+                raise CancelledError()
+    finally:
+        if owns_executor:
+            executor.shutdown()
+
+    return rank_results(results)
+
+
+def format_results(results):
+    """Sıralı sonuçları düz metin tablo olarak biçimlendir"""
+    # Ad sütunları en uzun kayıtlı ada göre genişletilir (ör. "Categorical Cross Entropy")
+    activation_width = max(len('Aktivasyon'), *(len(name) for name in ACTIVATION_FUNCTIONS)) + 2
+    loss_width = max(len(name) for name in LOSS_FUNCTIONS) + 2
+    optimizer_width = max(len('Optimizer'), *(len(name) for name in OPTIMIZERS)) + 2
+    header = (f"{'Sıra':>4}  {'Aktivasyon':<{activation_width}}{'Loss':<{loss_width}}"
+              f"{'Optimizer':<{optimizer_width}}{'LR':>10}{'Epoch':>8}{'MSE':>14}{'Son Loss':>14}{'Süre (s)':>10}")
+    lines = [header, "-" * len(header)]
+    for result in results:
+        lines.append(
+            f"{result['rank']:>4}  {result['activation']:<{activation_width}}{result['loss']:<{loss_width}}"
+            f"{result['optimizer']:<{optimizer_width}}"
+            f"{result['learning_rate']:>10g}{result['epochs']:>8}"
+            f"{result['mse']:>14.6g}{result['final_loss']:>14.6g}{result['wall_time']:>10.3f}"
+        )
+    return "\n".join(lines)
+
+
+class SweepWorker(threading.Thread):
+    """Taramayı arayüzü bloklamadan çalıştıran worker
+
+    Kuyruğa ('progress', tamamlanan, toplam), ('done', sonuçlar),
+    ('cancelled',) ya da ('error', mesaj) mesajları gönderilir.
+    """
+
+    def __init__(self, network_parameters, targets, learning_rates, epoch_counts, activation_names=None,
+                 loss_names=None, optimizer_names=None, max_workers=None):
+        super().__init__(daemon=True)
+        self.sweep_args = (network_parameters, targets, learning_rates, epoch_counts, activation_names,
+                           loss_names, optimizer_names)
+        self.messages = queue.Queue()
+        # Havuz worker başlamadan oluşturulur; cancel() her an güvenle çağrılabilir
+        self.executor = ProcessPoolExecutor(max_workers=max_workers)
+        self._cancel_event = threading.Event()
+
+    def run(self):
+        try:
+            results = run_sweep(
+                *self.sweep_args,
+                progress_callback=lambda done, total: self.messages.put(('progress', done, total)),
+                executor=self.executor
+            )
+        except CancelledError:
+            self.messages.put(('cancelled',))
+            return
+        except Exception as e:
+            # İptalden sonra kapatılmış havuza gönderim RuntimeError verir
+            if self._cancel_event.is_set():
+                self.messages.put(('cancelled',))
+            else:
+                self.messages.put(('error', str(e)))
+            return
+        finally:
+            self.executor.shutdown(wait=False)
+        self.messages.put(('done', results))
+
+    def cancel(self):
+        """Bekleyen kombinasyonları iptal et; çalışmakta olanlar tamamlanınca süreçler kapanır"""
+        self._cancel_event.set()
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,82 @@
+import numpy as np
+
+from network_functions import parameter_dtype
+
+
+class InferenceEngine:
+    """Yalnızca tahmin için ileri yayılım
+
+    NeuralNetwork.forward_propagation geri yayılım için her katmanın z ve
+    aktivasyon değerlerini saklar; tahminde bunlara gerek yoktur. Motor her
+    giriş şekli için yalnızca bir z tamponu ve katman çıktılarının sırayla
+    (ping-pong) yazıldığı iki tampon ayırır; aynı şekilli sonraki çağrılar
+    bellek ayırmaz. Aktivasyonlar hiçbir zaman yerinde (out is z) çağrılmaz.
+
+    Girişler tek bir örnek (features,) ya da bir batch (batch, features)
+    olabilir. predict() dönen diziyi motorun tamponundan verir; aynı şekilde
+    bir sonraki çağrıda üzerine yazılır (saklamak için .copy() kullanın).
+
+    Parametreler kopyalanmaz; yerinde yapılan değişiklikler tahmine yansır.
+    """
+
+    def __init__(self, weights, biases, activation, dtype=None):
+        dtype = np.dtype(dtype) if dtype is not None else np.result_type(*weights)
+        self.weights = [np.asarray(weight, dtype=dtype) for weight in weights]
+        self.biases = [np.asarray(bias, dtype=dtype) for bias in biases]
+        self.activation = activation
+        self.dtype = dtype
+        self.layer_sizes = [self.weights[0].shape[1]] + [weight.shape[0] for weight in self.weights]
+        self.buffers = {}
+
+    @classmethod
+    def from_parameters(cls, network_parameters, activation):
+        """network_parameters sözlüğünden (weights, biases, dtype) motor oluştur"""
+        return cls(
+            network_parameters['weights'],
+            network_parameters['biases'],
+            activation,
+            dtype=parameter_dtype(network_parameters)
+        )
+
+    def allocate(self, batch_shape):
+        """Verilen batch şekli için (z, çıktı, çıktı) tamponları; her katman bunların başını kullanır"""
+        buffers = self.buffers.get(batch_shape)
+        if buffers is None:
+            size = int(np.prod(batch_shape, dtype=np.int64)) * max(self.layer_sizes[1:])
+            buffers = tuple(np.empty(size, dtype=self.dtype) for _ in range(3))
+            self.buffers[batch_shape] = buffers
+        return buffers
+
+    def layer_view(self, buffer, batch_shape, count, width):
+        """Tamponun ilk count * width elemanının bitişik (batch..., width) görünümü"""
+        return buffer[:count * width].reshape(batch_shape + (width,))
+
+    def predict(self, inputs, layer_outputs=None):
+        """Girişler için ağ çıktısı (tek örnek veya batch)
+
+        layer_outputs bir liste olarak verilirse girişlerin ve her katman
+        çıktısının kopyaları bu listeye eklenir (ör. görselleştirme için).
+        """
+        inputs = np.asarray(inputs, dtype=self.dtype)
+        if inputs.shape[-1] != self.layer_sizes[0]:
+            raise ValueError(f"Giriş boyutu {inputs.shape[-1]}, ağın giriş katmanı {self.layer_sizes[0]} nöron")
+
+        batch_shape = inputs.shape[:-1]
+        buffers = self.allocate(batch_shape)
+        count = int(np.prod(batch_shape, dtype=np.int64))
+
+        current_values = inputs
+        if layer_outputs is not None:
+            layer_outputs.append(inputs.copy())
+        for i, (weight, bias) in enumerate(zip(self.weights, self.biases)):
+            width = weight.shape[0]
+            z = self.layer_view(buffers[0], batch_shape, count, width)
+            np.matmul(current_values, weight.T, out=z)
+            np.add(z, bias, out=z)
+            current_values = self.activation(z, out=self.layer_view(buffers[1 + i % 2], batch_shape, count, width))
+            if layer_outputs is not None:
+                layer_outputs.append(current_values.copy())
+        return current_values
+
+    def __call__(self, inputs):
+        return self.predict(inputs)
@@ -0,0 +1,103 @@
+import numpy as np
+
+from network_functions import DEFAULT_DTYPE, DTYPES
+
+# Başlatıcılar diziyi yerinde doldurur: her katman için tek bir vektörel
+# rastgele sayı çağrısı yapılır, ara dizi veya metin dönüşümü oluşmaz.
+# Weight dizileri (çıkış, giriş) şeklindedir; fan değerleri şekilden okunur.
+
+
+def fans(values):
+    """(fan_in, fan_out) değerleri; 1-D dizilerde ikisi de boyuta eşittir"""
+    if values.ndim == 2:
+        return values.shape[1], values.shape[0]
+    return values.size, values.size
+
+
+def fill_normal(values, rng, scale):
+    """N(0, scale²) ile yerinde doldur"""
+    rng.standard_normal(out=values, dtype=values.dtype)
+    values *= scale
+    return values
+
+
+def fill_uniform(values, rng, low, high):
+    """U(low, high) ile yerinde doldur"""
+    rng.random(out=values, dtype=values.dtype)
+    values *= high - low
+    values += low
+    return values
+
+
+def glorot_normal(values, rng):
+    """Xavier/Glorot normal: σ = sqrt(2 / (fan_in + fan_out))"""
+    fan_in, fan_out = fans(values)
+    return fill_normal(values, rng, np.sqrt(2.0 / (fan_in + fan_out)))
+
+
+def he_normal(values, rng):
+    """He normal (ReLU için): σ = sqrt(2 / fan_in)"""
+    fan_in, _ = fans(values)
+    return fill_normal(values, rng, np.sqrt(2.0 / fan_in))
+
+
+def lecun_uniform(values, rng):
+    """U(-1/sqrt(fan_in), 1/sqrt(fan_in))"""
+    fan_in, _ = fans(values)
+    limit = 1.0 / np.sqrt(fan_in)
+    return fill_uniform(values, rng, -limit, limit)
+
+
+def small_uniform(values, rng):
+    """Bias değerleri için U(0, 0.1)"""
+    return fill_uniform(values, rng, 0.0, 0.1)
+
+
+def zeros(values, rng=None):
+    values.fill(0.0)
+    return values
+
+
+# Ad -> (weight başlatıcı, bias başlatıcı)
+INITIALIZERS = {
+    "Xavier (Glorot)": (glorot_normal, small_uniform),
+    "He": (he_normal, small_uniform),
+    "Uniform": (lecun_uniform, small_uniform),
+    "Zeros": (zeros, zeros)
+}
+
+DEFAULT_INITIALIZER = "Xavier (Glorot)"
+
+
+def initialize_parameters(weights, biases, inputs=None, method=DEFAULT_INITIALIZER, seed=None):
+    """Verilen weight, bias ve (isteğe bağlı) input dizilerini yerinde başlat
+
+    Aynı seed ile her zaman aynı değerler üretilir. Inputlar U(-1, 1) ile doldurulur.
+    """
+    weight_init, bias_init = INITIALIZERS[method]
+    rng = np.random.default_rng(seed)
+
+    for weight, bias in zip(weights, biases):
+        weight_init(weight, rng)
+        bias_init(bias, rng)
+
+    if inputs is not None:
+        fill_uniform(inputs, rng, -1.0, 1.0)
+
+
+def random_parameters(layer_sizes, method=DEFAULT_INITIALIZER, seed=None, dtype=DEFAULT_DTYPE):
+    """Verilen katman yapısı için başlatılmış yeni bir parametre sözlüğü"""
+    weights = [
+        np.empty((n_out, n_in), dtype=DTYPES[dtype]) for n_in, n_out in zip(layer_sizes[:-1], layer_sizes[1:])
+    ]
+    biases = [np.empty(n_out, dtype=DTYPES[dtype]) for n_out in layer_sizes[1:]]
+    inputs = np.empty(layer_sizes[0], dtype=DTYPES[dtype])
+
+    initialize_parameters(weights, biases, inputs, method, seed)
+
+    return {
+        'inputs': inputs,
+        'biases': biases,
+        'weights': weights,
+        'dtype': dtype
+    }
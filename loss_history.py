@@ -0,0 +1,106 @@
+import numpy as np
+
+
+def lttb(x, y, max_points):
+    """Largest-Triangle-Three-Buckets ile eğrinin şeklini koruyarak örnek seç
+
+    İlk ve son nokta her zaman korunur; aradaki noktalar eşit kovalara bölünür ve
+    her kovadan, bir önceki seçilen nokta ile sonraki kovanın ortalamasıyla en
+    büyük üçgeni oluşturan nokta seçilir. Seçilen indeksleri döndürür.
+    """
+    count = len(y)
+    if max_points >= count:
+        return np.arange(count)
+    if max_points < 3:
+        return np.array([0, count - 1])[:max(max_points, 0)]
+
+    # Kova sınırları: ilk ve son nokta hariç count - 2 nokta, max_points - 2 kovaya bölünür
+    edges = np.linspace(1, count - 1, max_points - 1).astype(np.int64)
+    selected = np.empty(max_points, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = count - 1
+
+    # Iraksayan eğitimlerde loss NaN / inf olabilir; bu durumda ara hesaplar
+    # (inf - inf vb.) uyarı üretmeden NaN / inf verir ve alanlar aşağıda elenir
+    finite = bool(np.isfinite(y).all())
+    with np.errstate(invalid='ignore', over='ignore'):
+        # Her kovanın ortalaması tek geçişte hesaplanır; son nokta ayrı bir "kova" sayılır
+        sizes = np.diff(np.append(edges, count))
+        mean_x = np.add.reduceat(x, edges) / sizes
+        mean_y = np.add.reduceat(y, edges) / sizes
+
+        previous = 0
+        for bucket in range(max_points - 2):
+            start, end = edges[bucket], edges[bucket + 1]
+            previous_x, previous_y = x[previous], y[previous]
+            # Üçgen alanının iki katı; sabit terimler kova dışında hesaplanır
+            dx = previous_x - mean_x[bucket + 1]
+            dy = mean_y[bucket + 1] - previous_y
+            area = np.abs(dx * (y[start:end] - previous_y) + dy * (x[start:end] - previous_x))
+            if not finite:
+                # NaN / inf alanlar hiçbir zaman en büyük sayılmaz
+                area = np.where(np.isfinite(area), area, -1.0)
+            previous = start + int(np.argmax(area))
+            selected[bucket + 1] = previous
+
+    return selected
+
+
+class LossHistory:
+    """Epoch loss değerlerini önceden ayrılmış bir NumPy dizisinde tutan geçmiş
+
+    Python float listesi yerine epoch başına 8 bayt kullanır; kapasite dolarsa
+    iki katına büyütülür. downsample() çok uzun eğitimlerde bile grafik veya
+    dışa aktarma için sınırlı sayıda, eğrinin şeklini koruyan nokta döndürür.
+    """
+
+    def __init__(self, capacity=1024, dtype=np.float64):
+        self._values = np.empty(max(int(capacity), 1), dtype=dtype)
+        self._count = 0
+
+    @property
+    def values(self):
+        """Kaydedilmiş değerlerin (kopyasız) görünümü"""
+        return self._values[:self._count]
+
+    def reserve(self, capacity):
+        if capacity <= len(self._values):
+            return
+        values = np.empty(capacity, dtype=self._values.dtype)
+        values[:self._count] = self.values
+        self._values = values
+
+    def append(self, value):
+        if self._count == len(self._values):
+            self.reserve(2 * len(self._values))
+        self._values[self._count] = value
+        self._count += 1
+
+    def extend(self, values):
+        values = np.asarray(values, dtype=self._values.dtype).ravel()
+        if self._count + len(values) > len(self._values):
+            self.reserve(max(2 * len(self._values), self._count + len(values)))
+        self._values[self._count:self._count + len(values)] = values
+        self._count += len(values)
+
+    def clear(self):
+        self._count = 0
+
+    def downsample(self, max_points):
+        """(epoch indeksleri, loss değerleri): en fazla max_points nokta (LTTB)"""
+        y = self.values
+        x = np.arange(len(y), dtype=np.float64)
+        selected = lttb(x, y, max_points)
+        return selected, y[selected]
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, index):
+        return self.values[index]
+
+    def __iter__(self):
+        return iter(self.values)
+
+    def __array__(self, dtype=None, copy=None):
+        return self.values if dtype is None else self.values.astype(dtype)
@@ -1,10 +1,28 @@
+import time
+
+STARTUP_TIME = time.perf_counter()
+
+import importlib
+import sys
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
 from ttkbootstrap.constants import *
 from ttkbootstrap.scrolled import ScrolledFrame
 from network_visualizer import NetworkVisualizer
-from network_parameters import NetworkParametersWindow
-from network_prediction import NetworkPredictionWindow
+
+# numpy, matplotlib ve parametre/tahmin pencereleri ilk kullanıldıklarında
+# load_module ile yüklenir; böylece ilk pencere daha hızlı açılır.
+
+
+def load_module(name):
+    """Modülü ilk kullanımda yükle ve yükleme süresini raporla"""
+    if name in sys.modules:
+        return sys.modules[name]
+
+    start = time.perf_counter()
+    module = importlib.import_module(name)
+    print(f"[Başlangıç] {name} modülü {(time.perf_counter() - start) * 1000:.0f} ms'de yüklendi")
+    return module
 
 
 class HiddenLayerConfig(tk.Toplevel):
@@ -223,6 +241,12 @@ class NeuralNetworkConfigUI(tk.Tk):
             'hidden_layers': []
         }
 
+        self.after_idle(self.report_startup_time)
+
+    def report_startup_time(self):
+        """İlk pencerenin etkileşime hazır olma süresini raporla"""
+        print(f"[Başlangıç] İlk pencere {(time.perf_counter() - STARTUP_TIME) * 1000:.0f} ms'de hazır")
+
     def create_header(self):
         """Başlık ve açıklama bölümü"""
         header_frame = ttk.Frame(self.main_container)
@@ -356,6 +380,14 @@ class NeuralNetworkConfigUI(tk.Tk):
         )
         self.submit_button.pack(side=LEFT, padx=5)
 
+        self.load_button = ttk.Button(
+            self.button_frame,
+            text="Dosyadan Yükle",
+            bootstyle="info-outline",
+            command=self.load_network_from_file
+        )
+        self.load_button.pack(side=LEFT, padx=5)
+
     def create_result_area(self):
         """Sonuç gösterim alanı"""
         self.result_frame = ttk.LabelFrame(
@@ -392,6 +424,23 @@ class NeuralNetworkConfigUI(tk.Tk):
         )
         self.viz_canvas.pack(fill=BOTH, expand=YES, padx=10, pady=10)
 
+        # Görselleştirici tek sefer oluşturulur; yeniden boyutlandırmada yalnızca
+        # mevcut öğeler taşınır (art arda gelen <Configure> olayları birleştirilir)
+        self.visualizer = None
+        self.pending_layout = None
+        self.viz_canvas.bind("<Configure>", self.on_viz_canvas_resize)
+
+    def on_viz_canvas_resize(self, event):
+        """Canvas boyutu değişince yerleşim güncellemesini boşta zamana ertele"""
+        if self.visualizer is None or self.pending_layout is not None:
+            return
+        self.pending_layout = self.after_idle(self.apply_viz_layout)
+
+    def apply_viz_layout(self):
+        self.pending_layout = None
+        if self.visualizer is not None:
+            self.visualizer.update_layout()
+
     def update_visualization(self):
         """Ağ görselleştirmesini güncelle"""
         if not hasattr(self, 'viz_canvas'):
@@ -403,8 +452,21 @@ class NeuralNetworkConfigUI(tk.Tk):
             self.network_config['output_count']
         ]
 
-        visualizer = NetworkVisualizer(self.viz_canvas, layer_sizes)
-        visualizer.draw_network()
+        if self.visualizer is None:
+            self.visualizer = NetworkVisualizer(self.viz_canvas, layer_sizes)
+        else:
+            self.visualizer.set_layer_sizes(layer_sizes)
+        self.visualizer.draw_network()
+
+    def update_network_weights(self, weights):
+        """Eğitim sırasında bağlantı renklerini güncel ağırlıklarla yenile"""
+        if getattr(self, 'visualizer', None) is not None:
+            self.visualizer.update_weights(weights)
+
+    def update_network_activations(self, layer_outputs):
+        """Nöron renklerini son tahmindeki katman çıktılarıyla yenile"""
+        if getattr(self, 'visualizer', None) is not None:
+            self.visualizer.update_activations(layer_outputs)
 
     def on_focus_in(self, event, entry, placeholder):
         """Input focus olduğunda placeholder'ı temizle"""
@@ -428,7 +490,10 @@ class NeuralNetworkConfigUI(tk.Tk):
             entry.configure(bootstyle="primary")
 
         self.result_label.configure(text="Henüz yapılandırma girilmedi")
-        if hasattr(self, 'viz_canvas'):
+        if getattr(self, 'visualizer', None) is not None:
+            self.visualizer.clear()
+            self.visualizer = None
+        elif hasattr(self, 'viz_canvas'):
             self.viz_canvas.delete("all")
 
     def validate_input(self, value, placeholder):
@@ -481,6 +546,16 @@ class NeuralNetworkConfigUI(tk.Tk):
         """Hidden layer yapılandırması tamamlandığında çağrılır"""
         self.network_config['hidden_layers'] = hidden_layers
 
+        self.update_result_label()
+
+        self.update_visualization()
+
+        self.open_parameters_window()
+
+    def update_result_label(self):
+        """Ağ yapılandırması özetini güncelle"""
+        hidden_layers = self.network_config['hidden_layers']
+
         result_text = "Ağ Yapılandırması:\n\n"
         result_text += f"• Giriş Katmanı: {self.network_config['input_count']} nöron\n"
         result_text += "• Gizli Katmanlar:\n"
@@ -492,23 +567,52 @@ class NeuralNetworkConfigUI(tk.Tk):
 
         self.result_label.configure(text=result_text)
 
+    def load_network_from_file(self):
+        """Kaydedilmiş ağ parametrelerini yükle ve doğrudan tahmin penceresini aç"""
+        path = filedialog.askopenfilename(
+            parent=self,
+            title="Ağ Parametrelerini Yükle",
+            filetypes=[("YSA parametreleri", "*.json"), ("Tüm dosyalar", "*.*")]
+        )
+        if not path:
+            return
+
+        try:
+            parameters = load_module("network_io").load_network_parameters(path)
+        except Exception as e:
+            messagebox.showerror("Hata", f"Parametre dosyası yüklenemedi: {str(e)}")
+            return
+
+        layer_sizes = parameters['layer_sizes']
+        self.network_config.update({
+            'input_count': layer_sizes[0],
+            'hidden_count': len(layer_sizes) - 2,
+            'output_count': layer_sizes[-1],
+            'hidden_layers': layer_sizes[1:-1]
+        })
+
+        self.update_result_label()
+
         self.update_visualization()
 
-        self.open_parameters_window()
+        self.on_parameters_configured(parameters)
 
     def open_parameters_window(self):
         """Ağ parametreleri penceresini aç"""
-        parameters_window = NetworkParametersWindow(self, self.network_config)
+        parameters_module = load_module("network_parameters")
+        parameters_window = parameters_module.NetworkParametersWindow(self, self.network_config)
 
     def on_parameters_configured(self, parameters):
         """Ağ parametreleri yapılandırıldığında çağrılır"""
         self.network_parameters = parameters
+        self.update_network_weights(parameters['weights'])
         messagebox.showinfo(
             "Parametreler Kaydedildi",
             "Ağ parametreleri başarıyla kaydedildi!"
         )
 
-        prediction_window = NetworkPredictionWindow(
+        prediction_module = load_module("network_prediction")
+        prediction_window = prediction_module.NetworkPredictionWindow(
             self,
             parameters,
             self.network_config['output_count']
@@ -0,0 +1,230 @@
+import tkinter as tk
+from tkinter import ttk
+import ttkbootstrap as ttk
+from ttkbootstrap.constants import *
+
+
+class VirtualMatrixEditor(ttk.Frame):
+    """Büyük matrisler için sanallaştırılmış düzenleyici
+
+    Gerçek değerler bir NumPy dizisinde tutulur; yalnızca görünen satır ve
+    sütunlar için sabit sayıda Entry oluşturulur. Kaydırıldığında aynı Entry'ler
+    dizinin yeni penceresini gösterir, böylece pencere boyutu matris boyutundan
+    bağımsız olarak sabit sürede açılır.
+    """
+
+    def __init__(self, parent, values, visible_rows=10, visible_columns=8, cell_width=8,
+                 row_label="", column_label=""):
+        """
+        Args:
+            parent: Üst widget
+            values: Düzenlenecek 1-D veya 2-D NumPy dizisi (yerinde güncellenir)
+            visible_rows: Aynı anda gösterilecek en fazla satır sayısı
+            visible_columns: Aynı anda gösterilecek en fazla sütun sayısı
+            cell_width: Entry genişliği (karakter)
+            row_label: Satır başlıklarının öneki
+            column_label: Sütun başlıklarının öneki
+        """
+        super().__init__(parent)
+
+        self.row_label = row_label
+        self.column_label = column_label
+        self.cell_width = cell_width
+        self.max_visible_rows = visible_rows
+        self.max_visible_columns = visible_columns
+
+        # Geçersiz metin girilen hücreler: (satır, sütun) -> metin
+        self.invalid_cells = {}
+        self.row_offset = 0
+        self.column_offset = 0
+        self.entries = []
+        self.displayed_text = {}
+
+        self.set_values(values)
+
+    @property
+    def matrix(self):
+        """Değerlerin 2-D görünümü (1-D diziler tek satırlık matris olarak düzenlenir)"""
+        return self.values.reshape(1, -1) if self.values.ndim == 1 else self.values
+
+    def set_values(self, values):
+        """Düzenlenen diziyi değiştir; aynı şekildeyse widget'lar yeniden kullanılır"""
+        reuse = getattr(self, 'values', None) is not None and self.values.shape == values.shape
+        self.values = values
+        self.invalid_cells = {}
+
+        if reuse:
+            self.refresh()
+        else:
+            self.build()
+
+    def build(self):
+        """Görünen pencere kadar Entry ve başlık oluştur"""
+        for child in self.winfo_children():
+            child.destroy()
+
+        rows, columns = self.matrix.shape
+        self.visible_rows = min(rows, self.max_visible_rows)
+        self.visible_columns = min(columns, self.max_visible_columns)
+        self.row_offset = 0
+        self.column_offset = 0
+
+        self.column_headers = []
+        for k in range(self.visible_columns):
+            header = ttk.Label(self, font=("Helvetica", 9), bootstyle="secondary", anchor="center")
+            header.grid(row=0, column=k + 1, padx=2)
+            self.column_headers.append(header)
+
+        self.row_headers = []
+        self.entries = []
+        for j in range(self.visible_rows):
+            header = ttk.Label(self, font=("Helvetica", 9), bootstyle="secondary")
+            header.grid(row=j + 1, column=0, padx=(0, 5), sticky="e")
+            self.row_headers.append(header)
+
+            row_entries = []
+            for k in range(self.visible_columns):
+                entry = ttk.Entry(self, width=self.cell_width, bootstyle="primary")
+                entry.grid(row=j + 1, column=k + 1, padx=2, pady=2)
+                entry.bind('<FocusOut>', lambda e, j=j, k=k: self.commit_entry(j, k))
+                entry.bind('<Return>', lambda e, j=j, k=k: self.commit_entry(j, k))
+                entry.bind('<Up>', lambda e, j=j, k=k: self.move_focus(j, k, -1, 0))
+                entry.bind('<Down>', lambda e, j=j, k=k: self.move_focus(j, k, 1, 0))
+                for sequence in ('<MouseWheel>', '<Button-4>', '<Button-5>'):
+                    entry.bind(sequence, self.on_mouse_wheel)
+                row_entries.append(entry)
+            self.entries.append(row_entries)
+
+        self.vertical_scrollbar = None
+        if rows > self.visible_rows:
+            self.vertical_scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.yview)
+            self.vertical_scrollbar.grid(row=1, column=self.visible_columns + 1,
+                                         rowspan=self.visible_rows, sticky="ns", padx=(5, 0))
+
+        self.horizontal_scrollbar = None
+        if columns > self.visible_columns:
+            self.horizontal_scrollbar = ttk.Scrollbar(self, orient="horizontal", command=self.xview)
+            self.horizontal_scrollbar.grid(row=self.visible_rows + 1, column=1,
+                                           columnspan=self.visible_columns, sticky="ew", pady=(5, 0))
+
+        self.refresh()
+
+    def refresh(self):
+        """Görünen Entry'leri dizinin o anki penceresiyle doldur"""
+        matrix = self.matrix
+        self.displayed_text = {}
+
+        for k, header in enumerate(self.column_headers):
+            header.configure(text=f"{self.column_label}{self.column_offset + k + 1}")
+        for j, header in enumerate(self.row_headers):
+            header.configure(text=f"{self.row_label}{self.row_offset + j + 1}")
+
+        for j, row_entries in enumerate(self.entries):
+            row = self.row_offset + j
+            for k, entry in enumerate(row_entries):
+                column = self.column_offset + k
+                invalid_text = self.invalid_cells.get((row, column))
+                text = invalid_text if invalid_text is not None else self.format_value(matrix[row, column])
+
+                entry.delete(0, tk.END)
+                entry.insert(0, text)
+                entry.configure(bootstyle="danger" if invalid_text is not None else "primary")
+                self.displayed_text[(j, k)] = text
+
+        rows, columns = matrix.shape
+        if self.vertical_scrollbar is not None:
+            self.vertical_scrollbar.set(self.row_offset / rows, (self.row_offset + self.visible_rows) / rows)
+        if self.horizontal_scrollbar is not None:
+            self.horizontal_scrollbar.set(self.column_offset / columns,
+                                          (self.column_offset + self.visible_columns) / columns)
+
+    @staticmethod
+    def format_value(value):
+        return f"{value:.6g}"
+
+    def commit_entry(self, j, k):
+        """Entry metni değiştiyse diziye yaz; geçersizse hücreyi işaretle"""
+        entry = self.entries[j][k]
+        text = entry.get()
+        # Değişmeyen metin yazılmaz; böylece gösterim yuvarlaması değerleri bozmaz
+        if text == self.displayed_text.get((j, k)):
+            return
+
+        cell = (self.row_offset + j, self.column_offset + k)
+        self.displayed_text[(j, k)] = text
+        try:
+            self.matrix[cell] = float(text)
+        except ValueError:
+            self.invalid_cells[cell] = text
+            entry.configure(bootstyle="danger")
+            return
+
+        self.invalid_cells.pop(cell, None)
+        entry.configure(bootstyle="primary")
+
+    def commit(self):
+        """Görünen tüm Entry'lerdeki bekleyen düzenlemeleri diziye yaz"""
+        for j, row_entries in enumerate(self.entries):
+            for k in range(len(row_entries)):
+                self.commit_entry(j, k)
+
+    def first_error(self):
+        """İlk geçersiz hücre (satır, sütun, metin) ya da None"""
+        self.commit()
+        if not self.invalid_cells:
+            return None
+        (row, column), text = min(self.invalid_cells.items())
+        return row, column, text
+
+    def scroll_to(self, row_offset, column_offset):
+        """Görünen pencereyi verilen satır/sütun başlangıcına kaydır"""
+        rows, columns = self.matrix.shape
+        row_offset = max(0, min(int(row_offset), rows - self.visible_rows))
+        column_offset = max(0, min(int(column_offset), columns - self.visible_columns))
+        if (row_offset, column_offset) == (self.row_offset, self.column_offset):
+            return
+
+        self.commit()
+        self.row_offset = row_offset
+        self.column_offset = column_offset
+        self.refresh()
+
+    def scroll_offset(self, offset, visible, total, *args):
+        """Scrollbar komutunu ('moveto', kesir) / ('scroll', n, birim) yeni başlangıca çevir"""
+        if args[0] == "moveto":
+            return round(float(args[1]) * total)
+        step = int(args[1]) * (visible if args[2] == "pages" else 1)
+        return offset + step
+
+    def yview(self, *args):
+        rows = self.matrix.shape[0]
+        self.scroll_to(self.scroll_offset(self.row_offset, self.visible_rows, rows, *args), self.column_offset)
+
+    def xview(self, *args):
+        columns = self.matrix.shape[1]
+        self.scroll_to(self.row_offset,
+                       self.scroll_offset(self.column_offset, self.visible_columns, columns, *args))
+
+    def on_mouse_wheel(self, event):
+        if getattr(event, 'num', None) == 4 or getattr(event, 'delta', 0) > 0:
+            direction = -1
+        else:
+            direction = 1
+        self.scroll_to(self.row_offset + direction, self.column_offset)
+        return "break"
+
+    def move_focus(self, j, k, row_step, column_step):
+        """Ok tuşlarıyla hücreler arasında gez; pencere kenarında dizi kaydırılır"""
+        self.commit_entry(j, k)
+        target_j = j + row_step
+        target_k = k + column_step
+
+        if target_j < 0 or target_j >= self.visible_rows:
+            self.scroll_to(self.row_offset + row_step, self.column_offset)
+            target_j = j
+        if target_k < 0 or target_k >= self.visible_columns:
+            self.scroll_to(self.row_offset, self.column_offset + column_step)
+            target_k = k
+
+        self.entries[target_j][target_k].focus_set()
+        return "break"
@@ -5,8 +5,35 @@ from ttkbootstrap.constants import *
 import numpy as np
 import platform
 
+# Isı haritası renkleri: negatif değerler maviye, pozitif değerler kırmızıya doğru
+NEGATIVE_COLOR = np.array([33, 102, 172], dtype=np.float64)
+POSITIVE_COLOR = np.array([178, 24, 43], dtype=np.float64)
+ZERO_COLOR = np.array([247, 247, 247], dtype=np.float64)
+
+
+def colormap(values, limit):
+    """2-D diziyi [-limit, limit] aralığında ıraksak renk haritasıyla (satır, sütun, 3) uint8 RGB'ye çevir"""
+    t = np.clip(values / limit, -1.0, 1.0) if limit > 0 else np.zeros(values.shape)
+    # NaN/inf değerler renk ölçeğinin dışında kalır ve beyaz gösterilir
+    t = np.nan_to_num(t, nan=0.0)[..., np.newaxis]
+    rgb = ZERO_COLOR + np.where(t < 0, -t * (NEGATIVE_COLOR - ZERO_COLOR), t * (POSITIVE_COLOR - ZERO_COLOR))
+    return np.rint(rgb).astype(np.uint8)
+
+
+def heatmap_image(master, values, limit, zoom=1):
+    """Diziyi tek bir PhotoImage olarak oluştur (her hücre zoom×zoom piksel)"""
+    rgb = colormap(values, limit)
+    height, width = rgb.shape[:2]
+    ppm = f"P6 {width} {height} 255 ".encode() + rgb.tobytes()
+    image = tk.PhotoImage(master=master, data=ppm, format="PPM")
+    return image.zoom(zoom) if zoom > 1 else image
+
 
 class NetworkInfoWindow(tk.Toplevel):
+    # Isı haritalarının hedef genişliği ve bir hücrenin en büyük piksel boyutu
+    HEATMAP_WIDTH = 480
+    MAX_CELL_SIZE = 32
+
     def __init__(self, parent, network_parameters):
         super().__init__(parent)
 
@@ -79,53 +106,66 @@ class NetworkInfoWindow(tk.Toplevel):
         self.destroy()
 
     def show_parameters(self):
-        """Ağ parametrelerini göster"""
-        input_frame = ttk.LabelFrame(
-            self.scrollable_frame,
-            text="Input Değerleri",
-            bootstyle="primary"
-        )
-        input_frame.pack(fill=X, padx=10, pady=5)
+        """Ağ parametrelerini katman başına birer ısı haritası olarak göster"""
+        # PhotoImage nesneleri referans tutulmazsa çöp toplayıcı tarafından silinir
+        self.images = []
 
-        input_values = self.network_parameters['inputs']
-        for i, value in enumerate(input_values):
-            ttk.Label(
-                input_frame,
-                text=f"X{i + 1}: {value:.6f}",
-                font=("Helvetica", 12)
-            ).pack(padx=10, pady=2)
+        self.create_heatmap_section("Input Değerleri", self.network_parameters['inputs'], "X")
 
         for i in range(len(self.network_parameters['weights'])):
             layer_name = "Giriş → Gizli" if i == 0 else "Gizli → Çıkış" if i == len(
                 self.network_parameters['weights']) - 1 else f"Gizli {i} → Gizli {i + 1}"
 
-            weight_frame = ttk.LabelFrame(
-                self.scrollable_frame,
-                text=f"{layer_name} Ağırlıkları",
-                bootstyle="primary"
-            )
-            weight_frame.pack(fill=X, padx=10, pady=5)
-
-            weights = self.network_parameters['weights'][i]
-            for j in range(weights.shape[0]):
-                for k in range(weights.shape[1]):
-                    ttk.Label(
-                        weight_frame,
-                        text=f"w{j + 1}{k + 1}: {weights[j, k]:.6f}",
-                        font=("Helvetica", 12)
-                    ).pack(padx=10, pady=2)
-
-            bias_frame = ttk.LabelFrame(
-                self.scrollable_frame,
-                text=f"{layer_name} Bias Değerleri",
-                bootstyle="primary"
-            )
-            bias_frame.pack(fill=X, padx=10, pady=5)
-
-            biases = self.network_parameters['biases'][i]
-            for j, bias in enumerate(biases):
-                ttk.Label(
-                    bias_frame,
-                    text=f"b{j + 1}: {bias:.6f}",
-                    font=("Helvetica", 12)
-                ).pack(padx=10, pady=2) 
\ No newline at end of file
+            self.create_heatmap_section(f"{layer_name} Ağırlıkları", self.network_parameters['weights'][i], "w")
+            self.create_heatmap_section(f"{layer_name} Bias Değerleri", self.network_parameters['biases'][i], "b")
+
+    def create_heatmap_section(self, title, values, prefix):
+        """Dizi için ısı haritası, özet istatistikler ve üzerine gelince değer gösterimi"""
+        values = np.asarray(values, dtype=np.float64)
+        matrix = values.reshape(1, -1) if values.ndim == 1 else values
+
+        frame = ttk.LabelFrame(
+            self.scrollable_frame,
+            text=title,
+            bootstyle="primary"
+        )
+        frame.pack(fill=X, padx=10, pady=5)
+
+        finite = matrix[np.isfinite(matrix)]
+        limit = float(np.abs(finite).max()) if finite.size else 0.0
+        stats = (
+            f"Boyut: {' × '.join(str(size) for size in values.shape)}   "
+            f"min: {finite.min():.6f}   maks: {finite.max():.6f}   "
+            f"ort: {finite.mean():.6f}   std: {finite.std():.6f}"
+        ) if finite.size else f"Boyut: {' × '.join(str(size) for size in values.shape)}"
+        ttk.Label(
+            frame,
+            text=stats,
+            font=("Helvetica", 11)
+        ).pack(anchor=W, padx=10, pady=(5, 2))
+
+        zoom = max(1, min(self.MAX_CELL_SIZE, self.HEATMAP_WIDTH // max(matrix.shape)))
+        image = heatmap_image(self, matrix, limit, zoom)
+        self.images.append(image)
+
+        image_label = tk.Label(frame, image=image, borderwidth=0, highlightthickness=0, cursor="crosshair")
+        image_label.pack(anchor=W, padx=10, pady=2)
+
+        hover_label = ttk.Label(
+            frame,
+            text=f"Renk ölçeği: mavi -{limit:.4g} … beyaz 0 … kırmızı +{limit:.4g}",
+            font=("Helvetica", 10),
+            bootstyle="secondary"
+        )
+        hover_label.pack(anchor=W, padx=10, pady=(2, 5))
+        default_text = hover_label.cget("text")
+
+        def on_motion(event):
+            row, column = event.y // zoom, event.x // zoom
+            if not (0 <= row < matrix.shape[0] and 0 <= column < matrix.shape[1]):
+                return
+            name = f"{prefix}{row + 1},{column + 1}" if values.ndim == 2 else f"{prefix}{column + 1}"
+            hover_label.configure(text=f"{name}: {matrix[row, column]:.6f}")
+
+        image_label.bind("<Motion>", on_motion)
+        image_label.bind("<Leave>", lambda e: hover_label.configure(text=default_text))
@@ -0,0 +1,117 @@
+import json
+import os
+
+import numpy as np
+
+from network_functions import (ACTIVATION_FUNCTIONS, DEFAULT_DTYPE, DTYPES, LOSS_FUNCTIONS,
+                               layer_sizes_from_weights, parameter_count, parameter_views)
+
+# Dosya biçimi:
+#   <ad>.json - manifest (biçim adı, sürüm, dtype, katman boyutları, veri dosyası;
+#               isteğe bağlı olarak aktivasyon ve loss fonksiyonu adları)
+#   <ad>.npy  - tek bir düz dizi: [inputs, W0, b0, W1, b1, ...]
+# Veri tek bir .npy dosyasında tutulduğundan np.load(mmap_mode='r') ile açılabilir;
+# weight ve bias'lar bu dizinin kopyasız görünümleri olarak döner.
+FORMAT_NAME = "ysa-network-parameters"
+FORMAT_VERSION = 1
+
+
+def data_path_for(manifest_path):
+    """Manifest dosyasına karşılık gelen .npy veri dosyasının yolu"""
+    return os.path.splitext(manifest_path)[0] + ".npy"
+
+
+def save_network_parameters(path, network_parameters):
+    """network_parameters sözlüğünü manifest + düz .npy veri dosyası olarak kaydet
+
+    Sözlükte 'activation' / 'loss' adları varsa manifeste yazılır; tahmin
+    sırasında ağın eğitildiği aktivasyon fonksiyonu buradan okunur.
+    """
+    weights = network_parameters['weights']
+    biases = network_parameters['biases']
+    inputs = np.asarray(network_parameters['inputs'])
+    dtype_name = network_parameters.get('dtype', DEFAULT_DTYPE)
+    dtype = np.dtype(DTYPES[dtype_name])
+    activation_name = network_parameters.get('activation')
+    loss_name = network_parameters.get('loss')
+    if activation_name is not None and activation_name not in ACTIVATION_FUNCTIONS:
+        raise ValueError(f"Bilinmeyen aktivasyon fonksiyonu: {activation_name}")
+    if loss_name is not None and loss_name not in LOSS_FUNCTIONS:
+        raise ValueError(f"Bilinmeyen loss fonksiyonu: {loss_name}")
+
+    layer_sizes = layer_sizes_from_weights(weights)
+    if inputs.shape != (layer_sizes[0],):
+        raise ValueError(f"Input boyutu {inputs.shape} giriş katmanı ile uyumsuz: {layer_sizes[0]}")
+
+    buffer = np.empty(layer_sizes[0] + parameter_count(layer_sizes), dtype=dtype)
+    buffer[:layer_sizes[0]] = inputs
+    weight_views, bias_views = parameter_views(buffer[layer_sizes[0]:], layer_sizes)
+    for view, weight in zip(weight_views, weights):
+        view[...] = weight
+    for view, bias in zip(bias_views, biases):
+        view[...] = bias
+
+    data_path = data_path_for(path)
+    np.save(data_path, buffer)
+
+    manifest = {
+        'format': FORMAT_NAME,
+        'version': FORMAT_VERSION,
+        'dtype': dtype_name,
+        'layer_sizes': layer_sizes,
+        'data_file': os.path.basename(data_path)
+    }
+    if activation_name is not None:
+        manifest['activation'] = activation_name
+    if loss_name is not None:
+        manifest['loss'] = loss_name
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+
+
+def load_network_parameters(path, mmap=True):
+    """Kaydedilmiş network_parameters sözlüğünü yükle
+
+    mmap=True iken veri dosyası salt okunur olarak belleğe eşlenir; açılış süresi
+    model boyutundan bağımsızdır ve veri yalnızca erişildikçe okunur. Dönen
+    diziler salt okunurdur; eğitim öncesinde kopyalanmalıdır.
+
+    Manifestte kayıtlı değilse 'activation' ve 'loss' None olarak döner.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+
+    if manifest.get('format') != FORMAT_NAME:
+        raise ValueError("Dosya bir YSA parametre dosyası değil")
+    if manifest.get('version') != FORMAT_VERSION:
+        raise ValueError(f"Desteklenmeyen dosya sürümü: {manifest.get('version')}")
+    if manifest.get('dtype') not in DTYPES:
+        raise ValueError(f"Desteklenmeyen veri tipi: {manifest.get('dtype')}")
+    activation_name = manifest.get('activation')
+    loss_name = manifest.get('loss')
+    if activation_name is not None and activation_name not in ACTIVATION_FUNCTIONS:
+        raise ValueError(f"Bilinmeyen aktivasyon fonksiyonu: {activation_name}")
+    if loss_name is not None and loss_name not in LOSS_FUNCTIONS:
+        raise ValueError(f"Bilinmeyen loss fonksiyonu: {loss_name}")
+
+    layer_sizes = [int(size) for size in manifest['layer_sizes']]
+    data_path = os.path.join(os.path.dirname(path), manifest['data_file'])
+    buffer = np.load(data_path, mmap_mode='r' if mmap else None)
+
+    expected_size = layer_sizes[0] + parameter_count(layer_sizes)
+    if buffer.ndim != 1 or buffer.size != expected_size:
+        raise ValueError(f"Veri dosyası boyutu hatalı: {buffer.size} (beklenen {expected_size})")
+    if buffer.dtype != np.dtype(DTYPES[manifest['dtype']]):
+        raise ValueError(f"Veri dosyası tipi manifest ile uyumsuz: {buffer.dtype}")
+
+    weights, biases = parameter_views(buffer[layer_sizes[0]:], layer_sizes)
+
+    return {
+        'inputs': buffer[:layer_sizes[0]],
+        'biases': biases,
+        'weights': weights,
+        'dtype': manifest['dtype'],
+        'layer_sizes': layer_sizes,
+        'activation': activation_name,
+        'loss': loss_name
+    }
@@ -1,9 +1,13 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
 import ttkbootstrap as ttk
 from ttkbootstrap.constants import *
 from ttkbootstrap.scrolled import ScrolledFrame
 import numpy as np
+from network_functions import DTYPES, DEFAULT_DTYPE
+from network_io import load_network_parameters
+from matrix_editor import VirtualMatrixEditor
+from initializers import INITIALIZERS, DEFAULT_INITIALIZER, initialize_parameters
 
 
 class NetworkParametersWindow(tk.Toplevel):
@@ -28,15 +32,86 @@ class NetworkParametersWindow(tk.Toplevel):
         self.main_container = ttk.Frame(self.scroll_container)
         self.main_container.pack(fill=BOTH, expand=YES, padx=20, pady=20)
 
-        self.input_entries = []
-        self.bias_entries = []
-        self.weight_entries = []
+        # Değerler NumPy dizilerinde tutulur; editörler yalnızca görünen hücreler için widget oluşturur
+        self.input_values = np.zeros(self.layer_sizes[0])
+        self.bias_values = [np.zeros(size) for size in self.layer_sizes[1:]]
+        self.weight_values = [
+            np.zeros((n_out, n_in)) for n_in, n_out in zip(self.layer_sizes[:-1], self.layer_sizes[1:])
+        ]
+
+        self.input_editor = None
+        self.bias_editors = []
+        self.weight_editors = []
 
+        self.create_precision_section()
+        self.create_initializer_section()
         self.create_input_section()
         self.create_bias_section()
         self.create_weight_section()
         self.create_buttons()
 
+    def create_precision_section(self):
+        """Sayısal hassasiyet (dtype) seçimi"""
+        frame = ttk.LabelFrame(
+            self.main_container,
+            text="Sayısal Hassasiyet",
+            bootstyle="primary"
+        )
+        frame.pack(fill=X, pady=(0, 20))
+
+        ttk.Label(
+            frame,
+            text="Veri Tipi:",
+            font=("Helvetica", 12)
+        ).pack(side=LEFT, padx=(10, 10), pady=10)
+
+        self.dtype_var = tk.StringVar(value=DEFAULT_DTYPE)
+        ttk.Combobox(
+            frame,
+            textvariable=self.dtype_var,
+            values=list(DTYPES.keys()),
+            state="readonly",
+            width=10
+        ).pack(side=LEFT, pady=10)
+
+    def create_initializer_section(self):
+        """Rastgele başlangıç yöntemi ve tohum seçimi"""
+        frame = ttk.LabelFrame(
+            self.main_container,
+            text="Başlangıç Değerleri",
+            bootstyle="primary"
+        )
+        frame.pack(fill=X, pady=(0, 20))
+
+        ttk.Label(
+            frame,
+            text="Yöntem:",
+            font=("Helvetica", 12)
+        ).pack(side=LEFT, padx=(10, 10), pady=10)
+
+        self.initializer_var = tk.StringVar(value=DEFAULT_INITIALIZER)
+        ttk.Combobox(
+            frame,
+            textvariable=self.initializer_var,
+            values=list(INITIALIZERS.keys()),
+            state="readonly",
+            width=16
+        ).pack(side=LEFT, pady=10)
+
+        ttk.Label(
+            frame,
+            text="Tohum (seed):",
+            font=("Helvetica", 12)
+        ).pack(side=LEFT, padx=(20, 10), pady=10)
+
+        # Boş bırakılırsa her seferinde farklı değerler üretilir
+        self.seed_var = tk.StringVar(value="")
+        ttk.Entry(
+            frame,
+            textvariable=self.seed_var,
+            width=10
+        ).pack(side=LEFT, pady=10)
+
     def create_input_section(self):
         """Input değerleri için matris"""
         frame = ttk.LabelFrame(
@@ -46,7 +121,6 @@ class NetworkParametersWindow(tk.Toplevel):
         )
         frame.pack(fill=X, pady=(0, 20))
 
-        input_size = self.layer_sizes[0]
         entries_frame = ttk.Frame(frame)
         entries_frame.pack(fill=X, padx=10, pady=10)
 
@@ -56,15 +130,8 @@ class NetworkParametersWindow(tk.Toplevel):
             font=("Helvetica", 12)
         ).pack(side=LEFT, padx=(0, 10))
 
-        for i in range(input_size):
-            entry = ttk.Entry(
-                entries_frame,
-                width=8,
-                bootstyle="primary"
-            )
-            entry.pack(side=LEFT, padx=2)
-            entry.insert(0, "0.0")
-            self.input_entries.append(entry)
+        self.input_editor = VirtualMatrixEditor(entries_frame, self.input_values, column_label="X")
+        self.input_editor.pack(side=LEFT)
 
     def create_bias_section(self):
         """Her layer için bias değerleri"""
@@ -86,18 +153,9 @@ class NetworkParametersWindow(tk.Toplevel):
                 font=("Helvetica", 12)
             ).pack(side=LEFT, padx=(0, 10))
 
-            layer_biases = []
-            for j in range(self.layer_sizes[i]):
-                entry = ttk.Entry(
-                    layer_frame,
-                    width=8,
-                    bootstyle="primary"
-                )
-                entry.pack(side=LEFT, padx=2)
-                entry.insert(0, "0.0")
-                layer_biases.append(entry)
-
-            self.bias_entries.append(layer_biases)
+            editor = VirtualMatrixEditor(layer_frame, self.bias_values[i - 1])
+            editor.pack(side=LEFT)
+            self.bias_editors.append(editor)
 
     def create_weight_section(self):
         """Katmanlar arası weight değerleri"""
@@ -116,28 +174,10 @@ class NetworkParametersWindow(tk.Toplevel):
             )
             layer_frame.pack(fill=X, padx=10, pady=10)
 
-            matrix_frame = ttk.Frame(layer_frame)
-            matrix_frame.pack(padx=10, pady=10)
-
-            layer_weights = []
-            for j in range(self.layer_sizes[i + 1]):
-                row_weights = []
-                row_frame = ttk.Frame(matrix_frame)
-                row_frame.pack()
-
-                for k in range(self.layer_sizes[i]):
-                    entry = ttk.Entry(
-                        row_frame,
-                        width=8,
-                        bootstyle="primary"
-                    )
-                    entry.grid(row=j, column=k, padx=2, pady=2)
-                    entry.insert(0, "0.0")
-                    row_weights.append(entry)
-
-                layer_weights.append(row_weights)
-
-            self.weight_entries.append(layer_weights)
+            # Satırlar hedef nöronlar, sütunlar kaynak nöronlardır
+            editor = VirtualMatrixEditor(layer_frame, self.weight_values[i], row_label="→", column_label="←")
+            editor.pack(padx=10, pady=10)
+            self.weight_editors.append(editor)
 
     def get_weight_matrix_label(self, layer_idx):
         """Weight matrisi için etiket oluştur"""
@@ -170,6 +210,13 @@ class NetworkParametersWindow(tk.Toplevel):
             command=self.clear_values
         ).pack(side=LEFT, padx=5)
 
+        ttk.Button(
+            button_frame,
+            text="Dosyadan Yükle",
+            bootstyle="info-outline",
+            command=self.load_parameters
+        ).pack(side=LEFT, padx=5)
+
         ttk.Button(
             button_frame,
             text="Parametreleri Onayla",
@@ -177,48 +224,67 @@ class NetworkParametersWindow(tk.Toplevel):
             command=self.submit_parameters
         ).pack(side=LEFT, padx=5)
 
-    def randomize_values(self):
-        """Tüm değerlere rastgele sayılar ata"""
+    def editors(self):
+        """(dizi, editör) çiftleri: inputlar, biaslar ve weight'ler"""
+        return [(self.input_values, self.input_editor)] + \
+            list(zip(self.bias_values, self.bias_editors)) + \
+            list(zip(self.weight_values, self.weight_editors))
 
-        def get_scale(n_in, n_out):
-            return np.sqrt(2.0 / (n_in + n_out))
-
-        for entry in self.input_entries:
-            entry.delete(0, tk.END)
-            entry.insert(0, f"{np.random.uniform(-1, 1):.3f}")
-
-        for layer_biases in self.bias_entries:
-            for entry in layer_biases:
-                entry.delete(0, tk.END)
-                entry.insert(0, f"{np.random.uniform(0, 0.1):.3f}")
-
-        for i, layer_weights in enumerate(self.weight_entries):
-            n_in = self.layer_sizes[i]
-            n_out = self.layer_sizes[i + 1]
-            scale = get_scale(n_in, n_out)
+    def randomize_values(self):
+        """Tüm değerlere seçilen yöntemle rastgele sayılar ata"""
+        seed_text = self.seed_var.get().strip()
+        try:
+            seed = int(seed_text) if seed_text else None
+            if seed is not None and seed < 0:
+                raise ValueError
+        except ValueError:
+            messagebox.showerror("Hata", "Tohum boş veya negatif olmayan bir tam sayı olmalıdır")
+            return
+
+        # Diziler katman başına tek çağrıyla yerinde doldurulur; editörler yalnızca görünen hücreleri yeniler
+        initialize_parameters(
+            self.weight_values,
+            self.bias_values,
+            self.input_values,
+            method=self.initializer_var.get(),
+            seed=seed
+        )
 
-            for row_weights in layer_weights:
-                for entry in row_weights:
-                    entry.delete(0, tk.END)
-                    value = np.random.normal(0, scale)
-                    entry.insert(0, f"{value:.3f}")
+        for values, editor in self.editors():
+            editor.set_values(values)
 
     def clear_values(self):
         """Tüm değerleri sıfırla"""
-        for entry in self.input_entries:
-            entry.delete(0, tk.END)
-            entry.insert(0, "0.0")
+        for values, editor in self.editors():
+            values.fill(0.0)
+            editor.set_values(values)
+
+    def load_parameters(self):
+        """Kaydedilmiş parametreleri yükle ve girişleri atlayarak onayla"""
+        path = filedialog.askopenfilename(
+            parent=self,
+            title="Ağ Parametrelerini Yükle",
+            filetypes=[("YSA parametreleri", "*.json"), ("Tüm dosyalar", "*.*")]
+        )
+        if not path:
+            return
 
-        for layer_biases in self.bias_entries:
-            for entry in layer_biases:
-                entry.delete(0, tk.END)
-                entry.insert(0, "0.0")
+        try:
+            network_parameters = load_network_parameters(path)
+        except Exception as e:
+            messagebox.showerror("Hata", f"Parametre dosyası yüklenemedi: {str(e)}")
+            return
+
+        if network_parameters['layer_sizes'] != self.layer_sizes:
+            messagebox.showerror(
+                "Hata",
+                f"Dosyadaki katman yapısı ({network_parameters['layer_sizes']}) "
+                f"bu ağ ile uyumsuz ({self.layer_sizes})"
+            )
+            return
 
-        for layer_weights in self.weight_entries:
-            for row_weights in layer_weights:
-                for entry in row_weights:
-                    entry.delete(0, tk.END)
-                    entry.insert(0, "0.0")
+        self.parent.on_parameters_configured(network_parameters)
+        self.destroy()
 
     def validate_float(self, value):
         """Girilen değerin float olup olmadığını kontrol et"""
@@ -231,47 +297,34 @@ class NetworkParametersWindow(tk.Toplevel):
     def submit_parameters(self):
         """Parametreleri topla ve kontrol et"""
         try:
-            input_values = []
-            for entry in self.input_entries:
-                valid, error = self.validate_float(entry.get())
-                if not valid:
-                    messagebox.showerror("Hata", f"Input değeri hatalı: {error}")
-                    return
-                input_values.append(float(entry.get()))
-
-            bias_values = []
-            for layer_biases in self.bias_entries:
-                layer_bias = []
-                for entry in layer_biases:
-                    valid, error = self.validate_float(entry.get())
-                    if not valid:
-                        messagebox.showerror("Hata", f"Bias değeri hatalı: {error}")
+            dtype = DTYPES[self.dtype_var.get()]
+
+            checks = [("Input", [self.input_editor]), ("Bias", self.bias_editors), ("Weight", self.weight_editors)]
+            for name, editors in checks:
+                for editor in editors:
+                    error = editor.first_error()
+                    if error is not None:
+                        row, column, text = error
+                        editor.scroll_to(row, column)
+                        _, message = self.validate_float(text)
+                        messagebox.showerror("Hata", f"{name} değeri hatalı: {message}")
                         return
-                    layer_bias.append(float(entry.get()))
-                bias_values.append(np.array(layer_bias))
 
+            bias_values = [bias.astype(dtype) for bias in self.bias_values]
             weight_values = []
-            for layer_idx, layer_weights in enumerate(self.weight_entries):
-                layer_weight = []
-                for row_weights in layer_weights:
-                    row = []
-                    for entry in row_weights:
-                        valid, error = self.validate_float(entry.get())
-                        if not valid:
-                            messagebox.showerror("Hata", f"Weight değeri hatalı: {error}")
-                            return
-                        row.append(float(entry.get()))
-                    layer_weight.append(row)
-                weight_values.append(np.array(layer_weight))
-                print(f"Layer {layer_idx} weight matrix shape: {np.array(layer_weight).shape}")
+            for layer_idx, weight in enumerate(self.weight_values):
+                weight_values.append(weight.astype(dtype))
+                print(f"Layer {layer_idx} weight matrix shape: {weight_values[-1].shape}")
 
             network_parameters = {
-                'inputs': np.array(input_values),
+                'inputs': self.input_values.astype(dtype),
                 'biases': bias_values,
-                'weights': weight_values
+                'weights': weight_values,
+                'dtype': self.dtype_var.get()
             }
 
-            print("\nNetwork parameter shapes:")
+            print(f"\nNetwork parameter dtype: {network_parameters['dtype']}")
+            print("Network parameter shapes:")
             print(f"Inputs shape: {network_parameters['inputs'].shape}")
             for i in range(len(network_parameters['weights'])):
                 print(f"Layer {i}:")
@@ -1,10 +1,22 @@
+import os
+import queue
+import time
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
 import ttkbootstrap as ttk
 from ttkbootstrap.constants import *
 from ttkbootstrap.scrolled import ScrolledFrame
 import numpy as np
-from network_functions import ACTIVATION_FUNCTIONS, LOSS_FUNCTIONS, NeuralNetwork
+from network_functions import (ACTIVATION_FUNCTIONS, LOSS_FUNCTIONS, NeuralNetwork, parameter_dtype,
+                               supports_fused_output)
+from training_worker import TrainingWorker
+from inference import InferenceEngine
+from network_io import save_network_parameters
+from dataset import StreamingDataset
+from loss_history import LossHistory
+from stopping import StoppingCriteria
+from optimizers import OPTIMIZERS
+from schedules import SCHEDULES
 import matplotlib
 
 matplotlib.use('TkAgg')
@@ -14,12 +26,23 @@ from matplotlib.figure import Figure
 
 
 class NetworkPredictionWindow(tk.Toplevel):
+    # Worker kuyruğunun yoklanma aralığı ve loss grafiğinin saniyedeki en fazla yenilenme sayısı
+    POLL_INTERVAL_MS = 50
+    PLOT_MAX_FPS = 20
+    # Eğitim ne kadar uzun olursa olsun grafikte çizilecek en fazla nokta sayısı
+    PLOT_MAX_POINTS = 1000
+
     def __init__(self, parent, network_parameters, output_count):
         super().__init__(parent)
 
         self.parent = parent
         self.network_parameters = network_parameters
         self.output_count = output_count
+        self.training_worker = None
+        self.dataset_path = None
+        # Tahmin yollarının ortak kullandığı çıkarım motoru ve oluşturulduğu parametreler
+        self.inference_engine = None
+        self.inference_parameters = (None, None)
 
         self.title("Ağ Tahmin Sonuçları")
         self.geometry("1000x800")
@@ -52,7 +75,7 @@ class NetworkPredictionWindow(tk.Toplevel):
         self.protocol("WM_DELETE_WINDOW", self.on_closing)
 
     def create_function_selection(self):
-        """Aktivasyon ve loss fonksiyonu seçim bölümü"""
+        """Aktivasyon, loss fonksiyonu ve optimizer seçim bölümü"""
         frame = ttk.LabelFrame(
             self.main_container,
             text="Fonksiyon Seçimleri",
@@ -68,7 +91,9 @@ class NetworkPredictionWindow(tk.Toplevel):
             font=("Helvetica", 12)
         ).grid(row=0, column=0, padx=(10, 10), pady=5, sticky="w")
 
-        self.activation_var = tk.StringVar(value=list(ACTIVATION_FUNCTIONS.keys())[0])
+        # Parametreler dosyadan yüklendiyse kayıtlı aktivasyon / loss seçili gelir
+        self.activation_var = tk.StringVar(
+            value=self.network_parameters.get('activation') or list(ACTIVATION_FUNCTIONS.keys())[0])
         activation_combo = ttk.Combobox(
             frame,
             textvariable=self.activation_var,
@@ -84,7 +109,7 @@ class NetworkPredictionWindow(tk.Toplevel):
             font=("Helvetica", 12)
         ).grid(row=1, column=0, padx=(10, 10), pady=5, sticky="w")
 
-        self.loss_var = tk.StringVar(value=list(LOSS_FUNCTIONS.keys())[0])
+        self.loss_var = tk.StringVar(value=self.network_parameters.get('loss') or list(LOSS_FUNCTIONS.keys())[0])
         loss_combo = ttk.Combobox(
             frame,
             textvariable=self.loss_var,
@@ -94,6 +119,36 @@ class NetworkPredictionWindow(tk.Toplevel):
         )
         loss_combo.grid(row=1, column=1, padx=10, pady=5, sticky="w")
 
+        ttk.Label(
+            frame,
+            text="Optimizer:",
+            font=("Helvetica", 12)
+        ).grid(row=2, column=0, padx=(10, 10), pady=5, sticky="w")
+
+        self.optimizer_var = tk.StringVar(value=list(OPTIMIZERS.keys())[0])
+        optimizer_combo = ttk.Combobox(
+            frame,
+            textvariable=self.optimizer_var,
+            values=list(OPTIMIZERS.keys()),
+            state="readonly",
+            width=20
+        )
+        optimizer_combo.grid(row=2, column=1, padx=10, pady=5, sticky="w")
+
+        ttk.Label(
+            frame,
+            text="Birleşik Çıkış:",
+            font=("Helvetica", 12)
+        ).grid(row=3, column=0, padx=(10, 10), pady=5, sticky="w")
+
+        # Yalnızca Sigmoid + Cross Entropy ve Softmax + Categorical Cross Entropy için uygulanır
+        self.fused_output_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(
+            frame,
+            text="Sigmoid/Softmax + Cross Entropy gradyanını doğrudan hesapla",
+            variable=self.fused_output_var
+        ).grid(row=3, column=1, padx=10, pady=5, sticky="w")
+
     def create_actual_values_section(self):
         """Gerçek değerler bölümü"""
         frame = ttk.LabelFrame(
@@ -189,12 +244,157 @@ class NetworkPredictionWindow(tk.Toplevel):
         )
         lr_entry.grid(row=1, column=1, padx=10, pady=5, sticky="w")
 
+        ttk.Label(
+            frame,
+            text="LR Planı:",
+            font=("Helvetica", 12)
+        ).grid(row=2, column=0, padx=(10, 10), pady=5, sticky="w")
+
+        # Planlar varsayılan parametrelerini epoch sayısına göre ölçekler
+        self.schedule_var = tk.StringVar(value=list(SCHEDULES.keys())[0])
+        schedule_combo = ttk.Combobox(
+            frame,
+            textvariable=self.schedule_var,
+            values=list(SCHEDULES.keys()),
+            state="readonly",
+            width=20
+        )
+        schedule_combo.grid(row=2, column=1, padx=10, pady=5, sticky="w")
+
+        ttk.Label(
+            frame,
+            text="Veri Seti:",
+            font=("Helvetica", 12)
+        ).grid(row=3, column=0, padx=(10, 10), pady=5, sticky="w")
+
+        dataset_frame = ttk.Frame(frame)
+        dataset_frame.grid(row=3, column=1, padx=10, pady=5, sticky="w")
+
+        self.dataset_label = ttk.Label(
+            dataset_frame,
+            text="Seçilmedi (tek giriş vektörü kullanılır)",
+            font=("Helvetica", 10),
+            bootstyle="secondary"
+        )
+        self.dataset_label.pack(side=LEFT, padx=(0, 10))
+
         ttk.Button(
+            dataset_frame,
+            text="Seç",
+            bootstyle="info-outline",
+            command=self.select_dataset
+        ).pack(side=LEFT, padx=2)
+
+        ttk.Button(
+            dataset_frame,
+            text="Kaldır",
+            bootstyle="secondary-outline",
+            command=self.clear_dataset
+        ).pack(side=LEFT, padx=2)
+
+        ttk.Label(
+            frame,
+            text="Parça Boyutu:",
+            font=("Helvetica", 12)
+        ).grid(row=4, column=0, padx=(10, 10), pady=5, sticky="w")
+
+        self.chunk_size_var = tk.StringVar(value="1024")
+        ttk.Entry(
+            frame,
+            textvariable=self.chunk_size_var,
+            width=10
+        ).grid(row=4, column=1, padx=10, pady=5, sticky="w")
+
+        ttk.Label(
+            frame,
+            text="Erken Durdurma:",
+            font=("Helvetica", 12)
+        ).grid(row=5, column=0, padx=(10, 10), pady=5, sticky="nw")
+
+        # Boş bırakılan ölçütler devre dışıdır; NaN/inf ve patlayan loss her zaman durdurur
+        stopping_frame = ttk.Frame(frame)
+        stopping_frame.grid(row=5, column=1, padx=10, pady=5, sticky="w")
+
+        self.stopping_vars = {}
+        stopping_fields = [
+            ('tolerance', "Hedef Loss", ""),
+            ('relative_tolerance', "Göreli Tolerans", ""),
+            ('patience', "Sabır (epoch)", ""),
+            ('time_budget', "Süre Sınırı (s)", "")
+        ]
+        for column, (key, label, default) in enumerate(stopping_fields):
+            ttk.Label(
+                stopping_frame,
+                text=label,
+                font=("Helvetica", 10)
+            ).grid(row=0, column=column, padx=(0, 10), sticky="w")
+
+            self.stopping_vars[key] = tk.StringVar(value=default)
+            ttk.Entry(
+                stopping_frame,
+                textvariable=self.stopping_vars[key],
+                width=10
+            ).grid(row=1, column=column, padx=(0, 10), sticky="w")
+
+        self.train_button = ttk.Button(
             frame,
             text="Eğitimi Başlat",
             bootstyle="success",
             command=self.train_network
-        ).grid(row=2, column=0, columnspan=2, pady=10)
+        )
+        self.train_button.grid(row=6, column=0, columnspan=2, pady=10)
+
+    # Ölçüt -> (tür, Türkçe adı)
+    STOPPING_FIELDS = {
+        'tolerance': (float, "Hedef loss"),
+        'relative_tolerance': (float, "Göreli tolerans"),
+        'patience': (int, "Sabır"),
+        'time_budget': (float, "Süre sınırı")
+    }
+    # İlk epoch loss'unun (en az DIVERGENCE_FLOOR) bu katını aşan loss ıraksama sayılır;
+    # taban, ilk loss zaten çok küçükken olağan dalgalanmaların ıraksama sayılmasını önler
+    DIVERGENCE_FACTOR = 1e3
+    DIVERGENCE_FLOOR = 1e-3
+
+    def create_stopping_criteria(self):
+        """Erken durdurma alanlarından StoppingCriteria oluştur; hatalı girişte None"""
+        values = {}
+        for key, (cast, name) in self.STOPPING_FIELDS.items():
+            text = self.stopping_vars[key].get().strip()
+            if not text:
+                continue
+            try:
+                value = cast(text)
+                if value < 0 or (key in ('patience', 'time_budget') and value == 0):
+                    raise ValueError
+            except ValueError:
+                messagebox.showerror("Hata", f"{name} pozitif bir sayı olmalıdır (devre dışı için boş bırakın)")
+                return None
+            values[key] = value
+
+        return StoppingCriteria(
+            divergence_factor=self.DIVERGENCE_FACTOR,
+            divergence_floor=self.DIVERGENCE_FLOOR,
+            **values
+        )
+
+    def select_dataset(self):
+        """Eğitim için CSV / .npy veri seti seç"""
+        path = filedialog.askopenfilename(
+            parent=self,
+            title="Veri Seti Seç",
+            filetypes=[("Veri setleri", "*.csv *.npy"), ("Tüm dosyalar", "*.*")]
+        )
+        if not path:
+            return
+
+        self.dataset_path = path
+        self.dataset_label.configure(text=os.path.basename(path), bootstyle="info")
+
+    def clear_dataset(self):
+        """Veri seti seçimini kaldır"""
+        self.dataset_path = None
+        self.dataset_label.configure(text="Seçilmedi (tek giriş vektörü kullanılır)", bootstyle="secondary")
 
     def create_loss_plot(self):
         """Loss grafiği bölümü"""
@@ -218,8 +418,35 @@ class NetworkPredictionWindow(tk.Toplevel):
         self.ax.set_ylabel('Loss')
         self.ax.set_title('Eğitim Loss Değişimi')
         self.ax.grid(True)
+
+        # Loss çizgisi kalıcıdır ve yalnızca set_data ile güncellenir. animated=True
+        # olduğundan normal çizimde atlanır; eksenler değişmedikçe önbelleğe alınmış
+        # arka plan üzerine yalnızca çizgi blit edilir.
+        self.loss_line, = self.ax.plot([], [], 'b-', label='Loss', animated=True)
+        self.plot_background = None
+        self.canvas.mpl_connect('draw_event', self.on_plot_draw)
+
+        self.reset_loss_plot()
+        self.fig.tight_layout()
         self.canvas.draw()
 
+    def on_plot_draw(self, event):
+        """Tam çizimden sonra arka planı önbelleğe al ve çizgiyi üzerine çiz"""
+        self.plot_background = self.canvas.copy_from_bbox(self.ax.bbox)
+        self.ax.draw_artist(self.loss_line)
+
+    def reset_loss_plot(self, epochs=None):
+        """Yeni eğitim için grafiği ve artımlı olarak izlenen sınırları sıfırla"""
+        self.last_plot_time = 0.0
+        self.plotted_count = 0
+        self.loss_min = np.inf
+        self.loss_max = -np.inf
+        self.loss_limits_fitted = False
+        self.loss_line.set_data([], [])
+        # Epoch sayısı biliniyorsa x ekseni baştan sabitlenir, eğitim boyunca değişmez
+        self.ax.set_xlim([0, epochs or 10])
+        self.ax.set_ylim([0, 1])
+
     def create_buttons(self):
         """Butonlar"""
         button_frame = ttk.Frame(self.main_container)
@@ -232,31 +459,76 @@ class NetworkPredictionWindow(tk.Toplevel):
             command=self.show_comparison
         ).pack(side=LEFT, padx=5)
 
+        ttk.Button(
+            button_frame,
+            text="Parametreleri Kaydet",
+            bootstyle="success-outline",
+            command=self.save_parameters
+        ).pack(side=LEFT, padx=5)
+
+        ttk.Button(
+            button_frame,
+            text="Hiperparametre Taraması",
+            bootstyle="info-outline",
+            command=self.open_sweep_window
+        ).pack(side=LEFT, padx=5)
+
         ttk.Button(
             button_frame,
             text="Kapat",
             bootstyle="secondary-outline",
-            command=self.destroy
+            command=self.on_closing
         ).pack(side=LEFT, padx=5)
 
+    def get_inference_engine(self):
+        """Güncel parametreler ve seçili aktivasyon için çıkarım motoru
+
+        Parametreler (eğitim sonrası yeni diziler) veya aktivasyon değişmedikçe
+        aynı motor ve çıkış tamponları yeniden kullanılır.
+        """
+        activation = ACTIVATION_FUNCTIONS[self.activation_var.get()]
+        weights = self.network_parameters['weights']
+        biases = self.network_parameters['biases']
+        engine = self.inference_engine
+        if (engine is None or engine.activation is not activation
+                or self.inference_parameters[0] is not weights or self.inference_parameters[1] is not biases):
+            engine = InferenceEngine.from_parameters(self.network_parameters, activation)
+            self.inference_engine = engine
+            self.inference_parameters = (weights, biases)
+        return engine
+
     def calculate_predictions(self):
-        """İleri yayılım ile tahminleri hesapla"""
+        """İleri yayılım ile tahminleri hesapla ve nöronları aktivasyonlarına göre renklendir"""
         try:
-            current_values = self.network_parameters['inputs']
-
-            for i in range(len(self.network_parameters['weights'])):
-                z = np.dot(self.network_parameters['weights'][i], current_values)
-
-                z = z + self.network_parameters['biases'][i]
-
-                current_values = ACTIVATION_FUNCTIONS[self.activation_var.get()][0](z)
-
-            return current_values
+            layer_outputs = []
+            # Dönen dizi motorun tamponudur; sonraki tahminde üzerine yazılmaması için kopyalanır
+            predicted_values = self.get_inference_engine().predict(
+                self.network_parameters['inputs'], layer_outputs
+            ).copy()
+            self.show_network_activations(layer_outputs)
+            return predicted_values
 
         except Exception as e:
             print(f"Tahmin hesaplanırken hata: {str(e)}")
             return np.zeros(self.output_count)
 
+    def evaluate_predictions(self):
+        """(gerçek değerler, tahminler, loss) döndür; gerçek değerler hatalıysa None"""
+        actual_values = []
+        for entry in self.actual_entries:
+            valid, error = self.validate_float(entry.get())
+            if not valid:
+                messagebox.showerror("Hata", f"Gerçek değer hatalı: {error}")
+                return None
+            actual_values.append(float(entry.get()))
+
+        predicted_values = self.calculate_predictions()
+
+        loss_func = LOSS_FUNCTIONS[self.loss_var.get()][0]
+        actual_array = np.array(actual_values, dtype=parameter_dtype(self.network_parameters))
+        loss_value = loss_func(predicted_values, actual_array)
+        return actual_values, predicted_values, loss_value
+
     def update_predictions(self):
         """Tahminleri güncelle ve göster"""
         try:
@@ -301,18 +573,10 @@ class NetworkPredictionWindow(tk.Toplevel):
     def show_predictions(self):
         """Tahminleri hesapla ve göster"""
         try:
-            actual_values = []
-            for entry in self.actual_entries:
-                valid, error = self.validate_float(entry.get())
-                if not valid:
-                    messagebox.showerror("Hata", f"Gerçek değer hatalı: {error}")
-                    return
-                actual_values.append(float(entry.get()))
-
-            predicted_values = self.calculate_predictions()
-
-            loss_func = LOSS_FUNCTIONS[self.loss_var.get()][0]
-            loss_value = loss_func(predicted_values, np.array(actual_values))
+            evaluation = self.evaluate_predictions()
+            if evaluation is None:
+                return
+            actual_values, predicted_values, loss_value = evaluation
 
             for widget in self.results_frame.winfo_children():
                 widget.destroy()
@@ -366,18 +630,10 @@ class NetworkPredictionWindow(tk.Toplevel):
     def show_comparison(self):
         """Tahmin ve gerçek değerleri karşılaştır"""
         try:
-            actual_values = []
-            for entry in self.actual_entries:
-                valid, error = self.validate_float(entry.get())
-                if not valid:
-                    messagebox.showerror("Hata", f"Gerçek değer hatalı: {error}")
-                    return
-                actual_values.append(float(entry.get()))
-
-            predicted_values = self.calculate_predictions()
-
-            loss_func = LOSS_FUNCTIONS[self.loss_var.get()][0]
-            loss_value = loss_func(predicted_values, np.array(actual_values))
+            evaluation = self.evaluate_predictions()
+            if evaluation is None:
+                return
+            actual_values, predicted_values, loss_value = evaluation
 
             result = "Karşılaştırma Sonuçları:\n\n"
             result += f"Seçilen Aktivasyon Fonksiyonu: {self.activation_var.get()}\n"
@@ -396,37 +652,80 @@ class NetworkPredictionWindow(tk.Toplevel):
         except Exception as e:
             messagebox.showerror("Hata", f"Beklenmeyen bir hata oluştu: {str(e)}")
 
-    def update_loss_plot(self, loss_history):
-        """Loss grafiğini güvenli bir şekilde güncelle"""
-        try:
-            self.ax.clear()
-
-            self.ax.plot(loss_history, 'b-', label='Loss')
-            self.ax.set_xlabel('Epoch')
-            self.ax.set_ylabel('Loss')
-            self.ax.set_title('Eğitim Loss Değişimi')
-            self.ax.grid(True)
-
-            if len(loss_history) > 0:
-                ymin = min(loss_history)
-                ymax = max(loss_history)
-                if ymin == ymax:
-                    margin = abs(ymin) * 0.1 if ymin != 0 else 0.1
-                else:
-                    margin = (ymax - ymin) * 0.1
-                self.ax.set_ylim([ymin - margin, ymax + margin])
+    def update_loss_plot(self, loss_history, final=False):
+        """Loss grafiğini güvenli bir şekilde güncelle
 
-            self.ax.set_xlim([0, len(loss_history)])
-
-            self.fig.tight_layout()
-
-            self.canvas.draw()
+        Ara güncellemeler PLOT_MAX_FPS ile sınırlanır ve eksenler değişmedikçe yalnızca
+        çizgi blit edilir. final=True ise sınırlar verilere tam oturtulur ve tüm
+        figür yeniden çizilir.
+        """
+        try:
+            now = time.perf_counter()
+            if not final and now - self.last_plot_time < 1.0 / self.PLOT_MAX_FPS:
+                return
+            self.last_plot_time = now
+
+            count = len(loss_history)
+            if count < self.plotted_count:
+                self.reset_loss_plot()
+
+            # Sınırlar yalnızca son çizimden bu yana eklenen değerlerle güncellenir
+            new_values = np.asarray(loss_history[self.plotted_count:], dtype=np.float64)
+            new_values = new_values[np.isfinite(new_values)]
+            if new_values.size:
+                self.loss_min = min(self.loss_min, float(new_values.min()))
+                self.loss_max = max(self.loss_max, float(new_values.max()))
+            self.plotted_count = count
+
+            # Çok uzun eğitimlerde eğri şekli korunarak sınırlı sayıda noktaya indirgenir
+            self.loss_line.set_data(*loss_history.downsample(self.PLOT_MAX_POINTS))
+
+            if final:
+                self.fit_loss_limits(count, headroom=0.1)
+                self.fig.tight_layout()
+                self.canvas.draw()
+            elif self.loss_limits_exceeded(count):
+                # Eksen değişimi tam çizim gerektirir; sık tekrarlanmaması için pay bırakılır
+                xmax = self.ax.get_xlim()[1]
+                self.fit_loss_limits(xmax if count <= xmax else max(count * 2, 10), headroom=0.25)
+                self.canvas.draw()
+            elif self.plot_background is None:
+                self.canvas.draw()
+            else:
+                self.canvas.restore_region(self.plot_background)
+                self.ax.draw_artist(self.loss_line)
+                self.canvas.blit(self.ax.bbox)
 
         except Exception as e:
             print(f"Grafik güncellenirken hata: {str(e)}")
 
+    def loss_limits_exceeded(self, count):
+        """Çizilen veriler mevcut eksen sınırlarının dışına taştı mı"""
+        xmin, xmax = self.ax.get_xlim()
+        ymin, ymax = self.ax.get_ylim()
+        if count > xmax:
+            return True
+        if self.loss_min > self.loss_max:
+            return False
+        # İlk değerler geldiğinde y ekseni verinin ölçeğine oturtulur
+        return not self.loss_limits_fitted or self.loss_min < ymin or self.loss_max > ymax
+
+    def fit_loss_limits(self, xmax, headroom):
+        """Eksen sınırlarını izlenen min/max değerlerine göre ayarla"""
+        self.ax.set_xlim([0, max(xmax, 1)])
+        if self.loss_min > self.loss_max:
+            return
+        self.loss_limits_fitted = True
+        if self.loss_min == self.loss_max:
+            margin = abs(self.loss_min) * headroom if self.loss_min != 0 else 0.1
+        else:
+            margin = (self.loss_max - self.loss_min) * headroom
+        self.ax.set_ylim([self.loss_min - margin, self.loss_max + margin])
+
     def on_closing(self):
-        """Pencere kapatılırken matplotlib figure'ı temizle"""
+        """Pencere kapatılırken eğitimi durdur ve matplotlib figure'ı temizle"""
+        if self.training_worker is not None:
+            self.training_worker.cancel()
         try:
             plt.close(self.fig)
         except:
@@ -434,7 +733,10 @@ class NetworkPredictionWindow(tk.Toplevel):
         self.destroy()
 
     def train_network(self):
-        """Ağı eğit - input ve bias değerleri sabit kalır"""
+        """Ağı arka planda eğit - input değerleri sabit kalır"""
+        if self.training_worker is not None:
+            return
+
         try:
             epochs = int(self.epoch_var.get())
             if epochs <= 0:
@@ -446,10 +748,36 @@ class NetworkPredictionWindow(tk.Toplevel):
                 messagebox.showerror("Hata", "Learning rate pozitif bir sayı olmalıdır")
                 return
 
+            stopping = self.create_stopping_criteria()
+            if stopping is None:
+                return
+
+            dataset = None
+            if self.dataset_path is not None:
+                try:
+                    chunk_size = int(self.chunk_size_var.get())
+                except ValueError:
+                    chunk_size = 0
+                if chunk_size <= 0:
+                    messagebox.showerror("Hata", "Parça boyutu pozitif bir tam sayı olmalıdır")
+                    return
+                dataset = StreamingDataset(
+                    self.dataset_path,
+                    input_count=len(self.network_parameters['inputs']),
+                    output_count=self.output_count,
+                    chunk_size=chunk_size,
+                    dtype=parameter_dtype(self.network_parameters),
+                    # CSV başlık satırı varsa atla
+                    skip_header=self.count_csv_header_lines(self.dataset_path)
+                )
+
             actual_values = []
             for entry in self.actual_entries:
                 valid, error = self.validate_float(entry.get())
                 if not valid:
+                    if dataset is not None:
+                        actual_values = [0.0] * self.output_count
+                        break
                     messagebox.showerror("Hata", f"Gerçek değer hatalı: {error}")
                     return
                 actual_values.append(float(entry.get()))
@@ -457,95 +785,224 @@ class NetworkPredictionWindow(tk.Toplevel):
             activation_name = self.activation_var.get()
             loss_name = self.loss_var.get()
 
-            activation_func, activation_derivative = ACTIVATION_FUNCTIONS[activation_name]
+            activation = ACTIVATION_FUNCTIONS[activation_name]
             loss_func, loss_derivative = LOSS_FUNCTIONS[loss_name]
 
-            original_inputs = self.network_parameters['inputs'].copy()
-            original_biases = [bias.copy() for bias in self.network_parameters['biases']]
-
+            # Worker kendi kopyaları üzerinde çalışır; arayüz eğitim bitene kadar
+            # network_parameters'ı güvenle okuyabilir
             network = NeuralNetwork(
-                weights=self.network_parameters['weights'].copy(),
-                biases=original_biases,
-                activation_func=activation_func,
-                activation_derivative=activation_derivative,
+                weights=[weight.copy() for weight in self.network_parameters['weights']],
+                biases=[bias.copy() for bias in self.network_parameters['biases']],
+                activation_func=activation,
+                activation_derivative=activation.derivative,
                 loss_func=loss_func,
                 loss_derivative=loss_derivative,
-                learning_rate=learning_rate
+                learning_rate=learning_rate,
+                dtype=parameter_dtype(self.network_parameters),
+                optimizer=OPTIMIZERS[self.optimizer_var.get()](),
+                fused_output=self.fused_output_var.get() and supports_fused_output(activation_name, loss_name)
             )
 
-            progress_window = tk.Toplevel(self)
-            progress_window.title("Eğitim İlerlemesi")
-            progress_window.geometry("300x150")
-            progress_window.transient(self)
+            self.create_progress_window()
 
-            progress_label = ttk.Label(
-                progress_window,
-                text="Eğitim devam ediyor...",
-                font=("Helvetica", 12)
+            self.loss_history = LossHistory(epochs)
+            self.reset_loss_plot(epochs)
+            self.canvas.draw()
+            self.training_epochs = epochs
+            self.training_network = network
+
+            self.training_worker = TrainingWorker(
+                network,
+                self.network_parameters['inputs'].copy(),
+                np.array(actual_values, dtype=network.dtype),
+                epochs,
+                dataset=dataset,
+                # Ana penceredeki bağlantı renkleri eğitim sırasında canlı güncellenir
+                snapshot_weights=hasattr(self.parent, 'update_network_weights'),
+                stopping=stopping,
+                schedule=SCHEDULES[self.schedule_var.get()]()
             )
-            progress_label.pack(pady=10)
+            self.train_button.configure(state="disabled")
+            self.training_worker.start()
+            self.after(self.POLL_INTERVAL_MS, self.poll_training)
 
-            progress_bar = ttk.Progressbar(
-                progress_window,
-                length=200,
-                mode='determinate'
-            )
-            progress_bar.pack(pady=10)
+        except Exception as e:
+            messagebox.showerror("Hata", f"Eğitim sırasında bir hata oluştu: {str(e)}")
 
-            loss_label = ttk.Label(
-                progress_window,
-                text="Loss: -",
-                font=("Helvetica", 12)
-            )
-            loss_label.pack(pady=10)
+    def count_csv_header_lines(self, path):
+        """CSV dosyasının ilk satırı sayısal değilse başlık kabul et"""
+        if os.path.splitext(path)[1].lower() == ".npy":
+            return 0
+        with open(path, "r", encoding="utf-8") as f:
+            first_line = f.readline()
+        try:
+            [float(value) for value in first_line.split(",")]
+            return 0
+        except ValueError:
+            return 1
+
+    def create_progress_window(self):
+        """Eğitim ilerleme penceresi"""
+        self.progress_window = tk.Toplevel(self)
+        self.progress_window.title("Eğitim İlerlemesi")
+        self.progress_window.geometry("300x230")
+        self.progress_window.transient(self)
+        self.progress_window.protocol("WM_DELETE_WINDOW", self.cancel_training)
 
-            loss_history = []
-            update_interval = max(1, epochs // 100)
+        ttk.Label(
+            self.progress_window,
+            text="Eğitim devam ediyor...",
+            font=("Helvetica", 12)
+        ).pack(pady=10)
 
-            for epoch in range(epochs):
-                output = network.forward_propagation(original_inputs)
-                current_loss = network.loss_func(output, np.array(actual_values))
-                network.backward_propagation(original_inputs, np.array(actual_values))
+        self.progress_bar = ttk.Progressbar(
+            self.progress_window,
+            length=200,
+            mode='determinate'
+        )
+        self.progress_bar.pack(pady=10)
 
-                loss_history.append(float(current_loss))
+        self.progress_loss_label = ttk.Label(
+            self.progress_window,
+            text="Loss: -",
+            font=("Helvetica", 12)
+        )
+        self.progress_loss_label.pack(pady=10)
 
-                if epoch % update_interval == 0:
-                    progress = (epoch + 1) / epochs * 100
-                    progress_bar['value'] = progress
-                    loss_label['text'] = f"Loss: {current_loss:.6f}"
-                    progress_window.update()
+        button_frame = ttk.Frame(self.progress_window)
+        button_frame.pack(pady=5)
 
-                    if epoch % (update_interval * 10) == 0:
-                        self.update_loss_plot(loss_history)
+        self.pause_button = ttk.Button(
+            button_frame,
+            text="Duraklat",
+            bootstyle="warning-outline",
+            command=self.toggle_training_pause
+        )
+        self.pause_button.pack(side=LEFT, padx=5)
 
-            progress_window.destroy()
+        ttk.Button(
+            button_frame,
+            text="İptal",
+            bootstyle="danger-outline",
+            command=self.cancel_training
+        ).pack(side=LEFT, padx=5)
 
-            self.after(100, lambda: self.update_loss_plot(loss_history))
+    def toggle_training_pause(self):
+        """Eğitimi duraklat / devam ettir"""
+        if self.training_worker is None:
+            return
+        if self.training_worker.paused:
+            self.training_worker.resume()
+            self.pause_button.configure(text="Duraklat")
+        else:
+            self.training_worker.pause()
+            self.pause_button.configure(text="Devam Et")
+
+    def cancel_training(self):
+        """Eğitimi iptal et"""
+        if self.training_worker is not None:
+            self.training_worker.cancel()
+
+    def poll_training(self):
+        """Worker kuyruğunu boşalt ve arayüzü güncelle"""
+        worker = self.training_worker
+        if worker is None or not self.winfo_exists():
+            return
+
+        latest = None
+        finished = None
+        while True:
+            try:
+                message = worker.messages.get_nowait()
+            except queue.Empty:
+                break
 
-            self.network_parameters['weights'] = network.weights
-            self.network_parameters['inputs'] = original_inputs
-            self.network_parameters['biases'] = original_biases
+            if message[0] == 'progress':
+                self.loss_history.extend(message[3])
+                latest = message
+            else:
+                finished = message
+
+        if latest is not None and latest[2] is not None:
+            self.progress_bar['value'] = latest[1] / self.training_epochs * 100
+            self.progress_loss_label['text'] = f"Loss: {latest[2]:.6f}"
+            if worker.schedule is not None:
+                self.progress_loss_label['text'] += f"\nLR: {worker.network.learning_rate:.4g}"
+
+            self.update_loss_plot(self.loss_history)
+            if latest[4] is not None:
+                self.show_network_weights(latest[4])
+
+        if finished is None:
+            self.after(self.POLL_INTERVAL_MS, self.poll_training)
+            return
+
+        self.training_worker = None
+        self.train_button.configure(state="normal")
+        self.progress_window.destroy()
+
+        if finished[0] == 'error':
+            self.show_network_weights(self.network_parameters['weights'])
+            messagebox.showerror("Hata", f"Eğitim sırasında bir hata oluştu: {finished[1]}")
+        elif finished[0] == 'cancelled':
+            self.update_loss_plot(self.loss_history, final=True)
+            self.show_network_weights(self.network_parameters['weights'])
+            messagebox.showinfo(
+                "Eğitim İptal Edildi",
+                f"Eğitim {finished[1]}. epoch'ta iptal edildi.\nAğ parametreleri değiştirilmedi."
+            )
+        elif worker.stopping is not None and worker.stopping.diverged:
+            # Iraksayan ağın parametreleri kullanılamaz; mevcut parametreler korunur
+            self.update_loss_plot(self.loss_history, final=True)
+            self.show_network_weights(self.network_parameters['weights'])
+            messagebox.showerror(
+                "Eğitim Iraksadı",
+                f"Eğitim {finished[1]}. epoch'ta durduruldu: {finished[2]}.\n"
+                f"Ağ parametreleri değiştirilmedi; daha küçük bir learning rate deneyin."
+            )
+        else:
+            self.finish_training(self.training_network, finished[2])
 
-            print("\nGüncellenmiş Ağırlıklar:")
-            for i, weights in enumerate(self.network_parameters['weights']):
-                layer_name = "Giriş → Gizli" if i == 0 else "Gizli → Çıkış" if i == len(
-                    self.network_parameters['weights']) - 1 else f"Gizli {i} → Gizli {i + 1}"
-                print(f"\n{layer_name} Katmanı Ağırlıkları:")
-                print(weights)
+        self.training_network = None
 
-            self.after(200, self.update_predictions)
+    def finish_training(self, network, stop_reason=None):
+        """Eğitilmiş parametreleri uygula ve sonuçları göster"""
+        loss_history = self.loss_history
+        epochs = len(loss_history)
 
-            def show_completion_and_params():
-                messagebox.showinfo(
-                    "Eğitim Tamamlandı",
-                    f"Eğitim {epochs} epoch sonunda tamamlandı.\nSon loss değeri: {loss_history[-1]:.6f}"
-                )
-                self.show_updated_parameters()
+        self.after(100, lambda: self.update_loss_plot(loss_history, final=True))
 
-            self.after(300, show_completion_and_params)
+        self.network_parameters['weights'] = network.weights
+        self.network_parameters['biases'] = network.biases
+        self.show_network_weights(network.weights)
 
-        except Exception as e:
-            messagebox.showerror("Hata", f"Eğitim sırasında bir hata oluştu: {str(e)}")
+        print("\nGüncellenmiş Ağırlıklar:")
+        for i, weights in enumerate(self.network_parameters['weights']):
+            layer_name = "Giriş → Gizli" if i == 0 else "Gizli → Çıkış" if i == len(
+                self.network_parameters['weights']) - 1 else f"Gizli {i} → Gizli {i + 1}"
+            print(f"\n{layer_name} Katmanı Ağırlıkları:")
+            print(weights)
+
+        self.after(200, self.update_predictions)
+
+        def show_completion_and_params():
+            message = f"Eğitim {epochs} epoch sonunda tamamlandı.\nSon loss değeri: {loss_history[-1]:.6f}"
+            if stop_reason is not None:
+                message += f"\nErken durduruldu: {stop_reason}"
+            messagebox.showinfo("Eğitim Tamamlandı", message)
+            self.show_updated_parameters()
+
+        self.after(300, show_completion_and_params)
+
+    def show_network_weights(self, weights):
+        """Ana penceredeki ağ görselleştirmesini verilen ağırlıklarla renklendir"""
+        if hasattr(self.parent, 'update_network_weights'):
+            self.parent.update_network_weights(weights)
+
+    def show_network_activations(self, layer_outputs):
+        """Ana penceredeki nöronları katman çıktılarına göre renklendir"""
+        if hasattr(self.parent, 'update_network_activations'):
+            self.parent.update_network_activations(layer_outputs)
 
     def show_updated_parameters(self):
         """Güncellenmiş parametreleri yeni bir pencerede göster"""
@@ -556,6 +1013,49 @@ class NetworkPredictionWindow(tk.Toplevel):
         except Exception as e:
             messagebox.showerror("Hata", f"Parametre penceresi açılırken bir hata oluştu: {str(e)}")
 
+    def save_parameters(self):
+        """Güncel ağ parametrelerini dosyaya kaydet"""
+        path = filedialog.asksaveasfilename(
+            parent=self,
+            title="Ağ Parametrelerini Kaydet",
+            defaultextension=".json",
+            filetypes=[("YSA parametreleri", "*.json")]
+        )
+        if not path:
+            return
+
+        try:
+            save_network_parameters(path, dict(
+                self.network_parameters,
+                activation=self.activation_var.get(),
+                loss=self.loss_var.get()
+            ))
+            messagebox.showinfo("Kaydedildi", f"Ağ parametreleri kaydedildi:\n{path}")
+
+        except Exception as e:
+            messagebox.showerror("Hata", f"Parametreler kaydedilirken bir hata oluştu: {str(e)}")
+
+    def open_sweep_window(self):
+        """Hiperparametre tarama penceresini aç"""
+        actual_values = []
+        for entry in self.actual_entries:
+            valid, error = self.validate_float(entry.get())
+            if not valid:
+                messagebox.showerror("Hata", f"Gerçek değer hatalı: {error}")
+                return
+            actual_values.append(float(entry.get()))
+
+        try:
+            from sweep_window import SweepWindow
+            SweepWindow(
+                self,
+                self.network_parameters,
+                np.array(actual_values, dtype=parameter_dtype(self.network_parameters))
+            )
+
+        except Exception as e:
+            messagebox.showerror("Hata", f"Tarama penceresi açılırken bir hata oluştu: {str(e)}")
+
     def check_actual_values(self, event=None):
         """Gerçek değerlerin geçerliliğini kontrol et"""
         all_valid = True
@@ -4,115 +4,318 @@ import math
 
 
 class NetworkVisualizer:
-    def __init__(self, canvas, layer_sizes, padding=50):
+    def __init__(self, canvas, layer_sizes, padding=50, max_visible_neurons=16, max_connections=300):
         """
         Neural Network görselleştirici
-        
+
         Args:
             canvas: Çizim yapılacak tkinter canvas
             layer_sizes: Her katmandaki nöron sayılarını içeren liste
             padding: Kenarlardan bırakılacak boşluk
+            max_visible_neurons: Bir katmanda çizilecek en fazla nöron sayısı; daha
+                büyük katmanlarda aradaki nöronlar "… N daha" grubu olarak gösterilir
+            max_connections: İki katman arasında çizilecek en fazla bağlantı sayısı;
+                daha fazlası eşit aralıklarla örneklenir
         """
         self.canvas = canvas
         self.layer_sizes = layer_sizes
         self.padding = padding
+        self.max_visible_neurons = max(3, max_visible_neurons)
+        self.max_connections = max_connections
 
         self.neuron_radius = 15
         self.layer_spacing = None
         self.vertical_spacing = None
+        self.positions = []
+
+        # Canvas öğe kimlikleri; yeniden boyutlandırmada yalnızca coords, ağırlık ve
+        # aktivasyon değişimlerinde yalnızca itemconfigure çağrılır
+        self.neuron_items = {}      # (katman, nöron) -> (şekil id, etiket id veya None)
+        self.connection_items = {}  # (katman, kaynak nöron, hedef nöron) -> çizgi id
+        self.layer_label_items = []
+        self.item_styles = {}       # öğe id -> son uygulanan stil (gereksiz itemconfigure'ı önler)
         self.colors = {
             'input': "#4CAF50",
             'hidden': "#2196F3",
             'output': "#E53935",
-            'connection': "#888888"
+            'connection': "#888888",
+            'bundle': "#BBBBBB",
+            'group': "#EEEEEE"
         }
 
+    def visible_neurons(self, layer_idx):
+        """Katmanda çizilecek nöron indeksleri; None, toplanmış nöron grubunu temsil eder"""
+        layer_size = self.layer_sizes[layer_idx]
+        if layer_size <= self.max_visible_neurons:
+            return list(range(layer_size))
+
+        head = (self.max_visible_neurons - 1) // 2
+        tail = self.max_visible_neurons - 1 - head
+        return list(range(head)) + [None] + list(range(layer_size - tail, layer_size))
+
+    def hidden_neuron_count(self, layer_idx):
+        """Toplanmış gruptaki nöron sayısı"""
+        return self.layer_sizes[layer_idx] - (len(self.visible_neurons(layer_idx)) - 1)
+
     def calculate_layout(self):
-        """Canvas boyutlarına göre yerleşimi hesapla"""
+        """Canvas boyutlarına göre yerleşimi ve tüm nöron koordinatlarını bir kez hesapla"""
         width = self.canvas.winfo_width()
         height = self.canvas.winfo_height()
 
-        self.layer_spacing = (width - 2 * self.padding) / (len(self.layer_sizes) - 1)
+        self.layer_spacing = (width - 2 * self.padding) / max(len(self.layer_sizes) - 1, 1)
 
-        max_neurons = max(self.layer_sizes)
+        max_slots = max(len(self.visible_neurons(i)) for i in range(len(self.layer_sizes)))
         self.vertical_spacing = min(
-            (height - 2 * self.padding) / (max_neurons - 1) if max_neurons > 1 else height - 2 * self.padding,
+            (height - 2 * self.padding) / (max_slots - 1) if max_slots > 1 else height - 2 * self.padding,
             50
         )
 
+        # positions[katman] = [(nöron indeksi veya None, x, y), ...]
+        self.positions = []
+        for layer_idx in range(len(self.layer_sizes)):
+            neurons = self.visible_neurons(layer_idx)
+            x = self.padding + layer_idx * self.layer_spacing
+            y_start = (height - (len(neurons) - 1) * self.vertical_spacing) / 2
+            self.positions.append([
+                (neuron_idx, x, y_start + slot * self.vertical_spacing)
+                for slot, neuron_idx in enumerate(neurons)
+            ])
+
     def get_neuron_position(self, layer_idx, neuron_idx):
-        """Belirli bir nöronun x,y koordinatlarını hesapla"""
-        x = self.padding + layer_idx * self.layer_spacing
+        """Belirli bir nöronun x,y koordinatlarını hesapla (toplanmış gruptaysa grubun konumu)"""
+        if not self.positions:
+            self.calculate_layout()
 
-        layer_size = self.layer_sizes[layer_idx]
-        layer_height = (layer_size - 1) * self.vertical_spacing
-        y_start = (self.canvas.winfo_height() - layer_height) / 2
-        y = y_start + neuron_idx * self.vertical_spacing
+        group_position = None
+        for index, x, y in self.positions[layer_idx]:
+            if index == neuron_idx:
+                return x, y
+            if index is None:
+                group_position = (x, y)
+        return group_position
 
-        return x, y
+    def connection_pairs(self, layer_idx):
+        """İki katman arasında çizilecek (kaynak slot, hedef slot) çiftleri
 
-    def draw_network(self):
-        """Ağ yapısını çiz"""
+        Çift sayısı max_connections'ı aşarsa eşit aralıklarla örneklenir; böylece
+        çizim maliyeti katman boyutlarından bağımsız olarak sınırlı kalır.
+        """
+        source_count = len(self.positions[layer_idx])
+        target_count = len(self.positions[layer_idx + 1])
+        total = source_count * target_count
+
+        if total <= self.max_connections:
+            return [(s, t) for s in range(source_count) for t in range(target_count)]
+
+        step = total / self.max_connections
+        return [divmod(int(i * step), target_count) for i in range(self.max_connections)]
+
+    def set_layer_sizes(self, layer_sizes):
+        """Katman yapısını değiştir; yapı farklıysa bir sonraki çizim tüm öğeleri yeniden oluşturur"""
+        if list(layer_sizes) != list(self.layer_sizes):
+            self.layer_sizes = list(layer_sizes)
+            self.clear()
+
+    def clear(self):
+        """Tüm canvas öğelerini ve kimlik tablolarını temizle"""
         self.canvas.delete("all")
+        self.neuron_items = {}
+        self.connection_items = {}
+        self.layer_label_items = []
+        self.item_styles = {}
+
+    def draw_network(self):
+        """Ağ yapısını çiz; öğeler zaten varsa yalnızca konumlarını güncelle"""
+        if self.neuron_items:
+            self.update_layout()
+            return
+
+        self.clear()
         self.calculate_layout()
 
         for i in range(len(self.layer_sizes) - 1):
-            for j in range(self.layer_sizes[i]):
-                for k in range(self.layer_sizes[i + 1]):
-                    x1, y1 = self.get_neuron_position(i, j)
-                    x2, y2 = self.get_neuron_position(i + 1, k)
-                    self.canvas.create_line(
-                        x1, y1, x2, y2,
-                        fill=self.colors['connection'],
-                        width=1
-                    )
+            sources = self.positions[i]
+            targets = self.positions[i + 1]
+            for s, t in self.connection_pairs(i):
+                source_idx, x1, y1 = sources[s]
+                target_idx, x2, y2 = targets[t]
+                bundled = source_idx is None or target_idx is None
+                self.connection_items[(i, source_idx, target_idx)] = self.canvas.create_line(
+                    x1, y1, x2, y2,
+                    fill=self.colors['bundle'] if bundled else self.colors['connection'],
+                    width=3 if bundled else 1
+                )
 
-        for i, layer_size in enumerate(self.layer_sizes):
-            for j in range(layer_size):
-                x, y = self.get_neuron_position(i, j)
+        for i, layer_positions in enumerate(self.positions):
+            for j, x, y in layer_positions:
+                if j is None:
+                    self.neuron_items[(i, None)] = self.draw_neuron_group(i, x, y)
+                    continue
 
-                if i == 0:
-                    color = self.colors['input']
-                    label = f"X{j + 1}"
-                elif i == len(self.layer_sizes) - 1:
-                    color = self.colors['output']
-                    label = f"Y{j + 1}"
-                else:
-                    color = self.colors['hidden']
-                    label = f"H{i}{j + 1}"
-
-                self.canvas.create_oval(
-                    x - self.neuron_radius,
-                    y - self.neuron_radius,
-                    x + self.neuron_radius,
-                    y + self.neuron_radius,
-                    fill=color,
+                label_item = None
+                shape_item = self.canvas.create_oval(
+                    *self.neuron_coords(x, y),
+                    fill=self.neuron_color(i),
                     outline="black"
                 )
 
                 if i == 0:
-                    self.canvas.create_text(
-                        x - self.neuron_radius - 20,
-                        y,
-                        text=label,
+                    label_item = self.canvas.create_text(
+                        *self.label_coords(i, x, y),
+                        text=f"X{j + 1}",
                         anchor="e"
                     )
                 elif i == len(self.layer_sizes) - 1:
-                    self.canvas.create_text(
-                        x + self.neuron_radius + 20,
-                        y,
-                        text=label,
+                    label_item = self.canvas.create_text(
+                        *self.label_coords(i, x, y),
+                        text=f"Y{j + 1}",
                         anchor="w"
                     )
 
+                self.neuron_items[(i, j)] = (shape_item, label_item)
+
         layer_names = ["Giriş Katmanı"] + [f"Gizli Katman {i + 1}" for i in range(len(self.layer_sizes) - 2)] + [
             "Çıkış Katmanı"]
         for i, name in enumerate(layer_names):
             x = self.padding + i * self.layer_spacing
-            self.canvas.create_text(
+            self.layer_label_items.append(self.canvas.create_text(
                 x,
                 self.padding / 2,
-                text=name,
+                text=f"{name} ({self.layer_sizes[i]})" if self.layer_sizes[i] > self.max_visible_neurons else name,
                 anchor="center",
                 font=("Helvetica", 10)
-            ) 
\ No newline at end of file
+            ))
+
+    def update_layout(self):
+        """Canvas boyutu değiştiğinde mevcut öğeleri yeniden oluşturmadan taşı"""
+        if not self.neuron_items:
+            return
+
+        self.calculate_layout()
+        positions = {
+            (i, j): (x, y)
+            for i, layer_positions in enumerate(self.positions)
+            for j, x, y in layer_positions
+        }
+
+        for (i, source_idx, target_idx), item in self.connection_items.items():
+            x1, y1 = positions[(i, source_idx)]
+            x2, y2 = positions[(i + 1, target_idx)]
+            self.canvas.coords(item, x1, y1, x2, y2)
+
+        for (i, j), (shape_item, label_item) in self.neuron_items.items():
+            x, y = positions[(i, j)]
+            if j is None:
+                self.canvas.coords(shape_item, *self.group_coords(x, y))
+                self.canvas.coords(label_item, x, y)
+                continue
+            self.canvas.coords(shape_item, *self.neuron_coords(x, y))
+            if label_item is not None:
+                self.canvas.coords(label_item, *self.label_coords(i, x, y))
+
+        for i, item in enumerate(self.layer_label_items):
+            self.canvas.coords(item, self.padding + i * self.layer_spacing, self.padding / 2)
+
+    def update_weights(self, weights):
+        """Bağlantıları ağırlıklara göre renklendir (pozitif: mavi, negatif: kırmızı; kalınlık |w|)
+
+        Yalnızca stili değişen çizgiler için itemconfigure çağrılır.
+        """
+        if not self.connection_items:
+            return
+
+        # Ağırlıklar NumPy dizisidir; ölçek her katman için bir kez hesaplanır
+        layer_scales = [float(abs(weight).max()) if weight.size else 0.0 for weight in weights]
+
+        for (i, source_idx, target_idx), item in self.connection_items.items():
+            if source_idx is None or target_idx is None or i >= len(weights):
+                continue
+
+            value = float(weights[i][target_idx, source_idx])
+            scale = layer_scales[i]
+            strength = abs(value) / scale if scale > 0 else 0.0
+
+            style = (
+                self.blend("#FFFFFF", "#1E88E5" if value >= 0 else "#E53935", 0.25 + 0.75 * strength),
+                1 + round(3 * strength)
+            )
+            self.apply_style(item, style, lambda fill, width: {'fill': fill, 'width': width})
+
+    def update_activations(self, layer_outputs):
+        """Nöronları aktivasyon değerine göre katman rengiyle doygunlaştır
+
+        Yalnızca çizilmiş (görünür) nöronlar dolaşılır; gruplanmış nöronlar atlanır.
+        """
+        if not self.neuron_items:
+            return
+
+        # Çıktılar NumPy dizisidir; ölçek her katman için bir kez hesaplanır
+        layer_scales = [float(abs(outputs).max()) if outputs.size else 0.0 for outputs in layer_outputs]
+
+        for (i, j), items in self.neuron_items.items():
+            if j is None or i >= len(layer_outputs) or j >= layer_outputs[i].size:
+                continue
+
+            scale = layer_scales[i]
+            strength = abs(float(layer_outputs[i][j])) / scale if scale > 0 else 0.0
+            style = (self.blend("#FFFFFF", self.neuron_color(i), 0.2 + 0.8 * strength),)
+            self.apply_style(items[0], style, lambda fill: {'fill': fill})
+
+    def apply_style(self, item, style, to_options):
+        """Stil öncekinden farklıysa öğeye uygula"""
+        if self.item_styles.get(item) == style:
+            return
+        self.item_styles[item] = style
+        self.canvas.itemconfigure(item, **to_options(*style))
+
+    @staticmethod
+    def blend(color_a, color_b, ratio):
+        """İki #RRGGBB rengi arasında doğrusal karışım"""
+        a = [int(color_a[k:k + 2], 16) for k in (1, 3, 5)]
+        b = [int(color_b[k:k + 2], 16) for k in (1, 3, 5)]
+        return "#" + "".join(f"{round(x + (y - x) * ratio):02X}" for x, y in zip(a, b))
+
+    def neuron_color(self, layer_idx):
+        if layer_idx == 0:
+            return self.colors['input']
+        if layer_idx == len(self.layer_sizes) - 1:
+            return self.colors['output']
+        return self.colors['hidden']
+
+    def neuron_coords(self, x, y):
+        return (
+            x - self.neuron_radius,
+            y - self.neuron_radius,
+            x + self.neuron_radius,
+            y + self.neuron_radius
+        )
+
+    def group_coords(self, x, y):
+        half_height = min(self.vertical_spacing / 2, self.neuron_radius)
+        return (
+            x - self.neuron_radius,
+            y - half_height,
+            x + self.neuron_radius,
+            y + half_height
+        )
+
+    def label_coords(self, layer_idx, x, y):
+        if layer_idx == 0:
+            return x - self.neuron_radius - 20, y
+        return x + self.neuron_radius + 20, y
+
+    def draw_neuron_group(self, layer_idx, x, y):
+        """Toplanmış nöron grubunu "… N daha" etiketiyle çiz"""
+        shape_item = self.canvas.create_rectangle(
+            *self.group_coords(x, y),
+            fill=self.colors['group'],
+            outline="#999999",
+            dash=(2, 2)
+        )
+        label_item = self.canvas.create_text(
+            x,
+            y,
+            text=f"… {self.hidden_neuron_count(layer_idx)} daha",
+            font=("Helvetica", 8)
+        )
+        return shape_item, label_item
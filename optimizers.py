@@ -0,0 +1,139 @@
+from functools import partial
+
+import numpy as np
+
+# Optimizer'lar parametre dizilerini yerinde günceller. Durum tamponları (hız,
+# momentler, ara tampon) ilk adımda her parametre için bir kez ayrılır ve sonraki
+# adımlarda `out=` ile yeniden kullanılır. Düz parametre modunda tek bir
+# parametre/gradyan tamponu verildiğinden her durum da tek bir tampondur.
+# step() gradyan dizilerini ara sonuç için kullanabilir (üzerine yazar).
+
+
+class Optimizer:
+    """Temel optimizer: durum yönetimi ve adım sayacı"""
+
+    def __init__(self, learning_rate=0.01):
+        self.learning_rate = learning_rate
+        self.state = None
+        self.iterations = 0
+
+    def reset(self):
+        """Durum tamponlarını ve adım sayacını sıfırla"""
+        self.state = None
+        self.iterations = 0
+
+    def allocate(self, parameter):
+        """Bir parametre için durum tamponları (alt sınıflar tanımlar)"""
+        return ()
+
+    def step(self, parameters, gradients):
+        """parameters ve gradients eşit uzunlukta dizi listeleridir"""
+        if self.state is None or len(self.state) != len(parameters):
+            self.state = [self.allocate(parameter) for parameter in parameters]
+        self.iterations += 1
+        for parameter, gradient, state in zip(parameters, gradients, self.state):
+            self.update(parameter, gradient, *state)
+
+    def update(self, parameter, gradient, *state):
+        raise NotImplementedError
+
+
+class SGD(Optimizer):
+    """p -= lr * g"""
+
+    def update(self, parameter, gradient):
+        np.subtract(parameter, np.multiply(gradient, self.learning_rate, out=gradient), out=parameter)
+
+
+class Momentum(Optimizer):
+    """Momentum (nesterov=True ise Nesterov): v = μv - lr*g; p += v"""
+
+    def __init__(self, learning_rate=0.01, momentum=0.9, nesterov=False):
+        super().__init__(learning_rate)
+        self.momentum = momentum
+        self.nesterov = nesterov
+
+    def allocate(self, parameter):
+        return (np.zeros_like(parameter),)
+
+    def update(self, parameter, gradient, velocity):
+        np.multiply(gradient, self.learning_rate, out=gradient)
+        np.multiply(velocity, self.momentum, out=velocity)
+        np.subtract(velocity, gradient, out=velocity)
+        if self.nesterov:
+            # p += μv - lr*g (güncellenmiş hız yönünde ileri bakış)
+            np.subtract(parameter, gradient, out=parameter)
+            np.add(parameter, np.multiply(velocity, self.momentum, out=gradient), out=parameter)
+        else:
+            np.add(parameter, velocity, out=parameter)
+
+
+class RMSProp(Optimizer):
+    """s = ρs + (1-ρ)g²; p -= lr * g / (sqrt(s) + ε)"""
+
+    def __init__(self, learning_rate=0.001, rho=0.9, epsilon=1e-8):
+        super().__init__(learning_rate)
+        self.rho = rho
+        self.epsilon = epsilon
+
+    def allocate(self, parameter):
+        return np.zeros_like(parameter), np.empty_like(parameter)
+
+    def update(self, parameter, gradient, square_average, scratch):
+        np.multiply(square_average, self.rho, out=square_average)
+        np.multiply(gradient, gradient, out=scratch)
+        np.multiply(scratch, 1.0 - self.rho, out=scratch)
+        np.add(square_average, scratch, out=square_average)
+
+        np.sqrt(square_average, out=scratch)
+        np.add(scratch, self.epsilon, out=scratch)
+        np.divide(gradient, scratch, out=gradient)
+        np.subtract(parameter, np.multiply(gradient, self.learning_rate, out=gradient), out=parameter)
+
+
+class Adam(Optimizer):
+    """Adam: yanlılığı düzeltilmiş birinci ve ikinci moment tahminleriyle uyarlanır adım"""
+
+    def __init__(self, learning_rate=0.001, beta1=0.9, beta2=0.999, epsilon=1e-8):
+        super().__init__(learning_rate)
+        self.beta1 = beta1
+        self.beta2 = beta2
+        self.epsilon = epsilon
+
+    def allocate(self, parameter):
+        return np.zeros_like(parameter), np.zeros_like(parameter), np.empty_like(parameter)
+
+    def step(self, parameters, gradients):
+        # Yanlılık düzeltme katsayıları her adımda bir kez hesaplanır
+        t = self.iterations + 1
+        self.bias_correction1 = 1.0 - self.beta1 ** t
+        self.bias_correction2_sqrt = np.sqrt(1.0 - self.beta2 ** t)
+        super().step(parameters, gradients)
+
+    def update(self, parameter, gradient, first_moment, second_moment, scratch):
+        np.multiply(first_moment, self.beta1, out=first_moment)
+        np.multiply(gradient, 1.0 - self.beta1, out=scratch)
+        np.add(first_moment, scratch, out=first_moment)
+
+        np.multiply(second_moment, self.beta2, out=second_moment)
+        np.multiply(gradient, gradient, out=scratch)
+        np.multiply(scratch, 1.0 - self.beta2, out=scratch)
+        np.add(second_moment, scratch, out=second_moment)
+
+        # p -= lr * m̂ / (sqrt(v̂) + ε)
+        np.sqrt(second_moment, out=scratch)
+        np.divide(scratch, self.bias_correction2_sqrt, out=scratch)
+        np.add(scratch, self.epsilon, out=scratch)
+        np.divide(first_moment, scratch, out=gradient)
+        np.multiply(gradient, self.learning_rate / self.bias_correction1, out=gradient)
+        np.subtract(parameter, gradient, out=parameter)
+
+
+# Ad -> learning_rate alan optimizer fabrikası
+OPTIMIZERS = {
+    "SGD": SGD,
+    "Momentum": Momentum,
+    "Nesterov": partial(Momentum, nesterov=True),
+    "RMSProp": RMSProp,
+    "Adam": Adam
+}
@@ -0,0 +1,131 @@
+import math
+
+# Learning rate planları: eğitim başında start(), her epoch sonunda step()
+# çağrılır ve dönen değer bir sonraki epoch'un learning rate'idir. Varsayılan
+# parametreler toplam epoch sayısına göre ölçeklenir; böylece arayüzde yalnızca
+# planın adını seçmek yeterlidir.
+
+
+class ConstantSchedule:
+    """Sabit learning rate (plan yok)"""
+
+    def start(self, base_learning_rate, epochs):
+        """Eğitim başında çağrılır; ilk epoch'un learning rate'ini döndürür"""
+        self.base_learning_rate = base_learning_rate
+        self.epochs = max(int(epochs), 1)
+        return self.learning_rate(0)
+
+    def learning_rate(self, epoch):
+        return self.base_learning_rate
+
+    def step(self, epoch, loss):
+        """epoch (0 tabanlı) tamamlandı; bir sonraki epoch'un learning rate'i"""
+        return self.learning_rate(epoch + 1)
+
+
+class StepDecay(ConstantSchedule):
+    """Her step_size epoch'ta learning rate gamma ile çarpılır (varsayılan: 4 basamak)"""
+
+    def __init__(self, step_size=None, gamma=0.5):
+        self.step_size = step_size
+        self.gamma = gamma
+
+    def learning_rate(self, epoch):
+        step_size = self.step_size or max(self.epochs // 4, 1)
+        return self.base_learning_rate * self.gamma ** (epoch // step_size)
+
+
+class ExponentialDecay(ConstantSchedule):
+    """lr = base * gamma^epoch; gamma verilmezse son epoch'ta base * final_ratio olur"""
+
+    def __init__(self, gamma=None, final_ratio=0.01):
+        self.gamma = gamma
+        self.final_ratio = final_ratio
+
+    def learning_rate(self, epoch):
+        gamma = self.gamma if self.gamma is not None else self.final_ratio ** (1.0 / self.epochs)
+        return self.base_learning_rate * gamma ** epoch
+
+
+class CosineAnnealing(ConstantSchedule):
+    """Learning rate yarım kosinüs eğrisiyle base'den min_ratio * base'e iner"""
+
+    def __init__(self, min_ratio=0.0):
+        self.min_ratio = min_ratio
+
+    def learning_rate(self, epoch):
+        minimum = self.base_learning_rate * self.min_ratio
+        progress = min(epoch / self.epochs, 1.0)
+        return minimum + 0.5 * (self.base_learning_rate - minimum) * (1.0 + math.cos(math.pi * progress))
+
+
+class Warmup(ConstantSchedule):
+    """İlk warmup_epochs boyunca learning rate doğrusal artar, ardından schedule uygulanır
+
+    warmup_epochs verilmezse toplam epoch'ların %5'i kullanılır.
+    """
+
+    def __init__(self, schedule=None, warmup_epochs=None):
+        self.schedule = schedule if schedule is not None else ConstantSchedule()
+        self.warmup_epochs = warmup_epochs
+
+    def start(self, base_learning_rate, epochs):
+        self.warmup = self.warmup_epochs if self.warmup_epochs is not None else max(int(epochs) // 20, 1)
+        # Isınmadan sonraki plan kalan epoch'lar üzerinden ölçeklenir
+        self.schedule.start(base_learning_rate, max(int(epochs) - self.warmup, 1))
+        return super().start(base_learning_rate, epochs)
+
+    def learning_rate(self, epoch):
+        if epoch < self.warmup:
+            return self.base_learning_rate * (epoch + 1) / (self.warmup + 1)
+        return self.schedule.learning_rate(epoch - self.warmup)
+
+    def step(self, epoch, loss):
+        if epoch + 1 < self.warmup:
+            return self.learning_rate(epoch + 1)
+        return self.schedule.step(epoch - self.warmup, loss)
+
+
+class ReduceOnPlateau(ConstantSchedule):
+    """Loss patience epoch boyunca göreli threshold kadar iyileşmezse learning rate factor ile çarpılır"""
+
+    def __init__(self, factor=0.5, patience=None, threshold=1e-4, min_learning_rate=1e-8):
+        self.factor = factor
+        self.patience = patience
+        self.threshold = threshold
+        self.min_learning_rate = min_learning_rate
+
+    def start(self, base_learning_rate, epochs):
+        self.current = base_learning_rate
+        self.best_loss = math.inf
+        self.bad_epochs = 0
+        # Varsayılan sabır: toplam epoch'ların %2'si (en az 5)
+        self.plateau_patience = self.patience if self.patience is not None else max(int(epochs) // 50, 5)
+        return super().start(base_learning_rate, epochs)
+
+    def learning_rate(self, epoch):
+        return self.current
+
+    def step(self, epoch, loss):
+        loss = float(loss)
+        if loss < self.best_loss * (1.0 - self.threshold):
+            self.best_loss = loss
+            self.bad_epochs = 0
+        else:
+            self.bad_epochs += 1
+            if self.bad_epochs >= self.plateau_patience:
+                self.current = max(self.current * self.factor, self.min_learning_rate)
+                self.bad_epochs = 0
+        return self.current
+
+
+# Ad -> yeni plan nesnesi oluşturan fabrika
+SCHEDULES = {
+    "Constant": ConstantSchedule,
+    "Step Decay": StepDecay,
+    "Exponential Decay": ExponentialDecay,
+    "Cosine Annealing": CosineAnnealing,
+    "Warmup": Warmup,
+    "Warmup + Cosine": lambda: Warmup(CosineAnnealing()),
+    "Reduce on Plateau": ReduceOnPlateau
+}
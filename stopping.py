@@ -0,0 +1,88 @@
+import math
+import time
+
+
+class StoppingCriteria:
+    """Eğitimi erken durdurma ölçütleri
+
+    Her epoch sonunda update(loss) çağrılır; durdurma gerekiyorsa nedeni
+    (okunabilir bir metin) döndürür, aksi halde None. Verilmeyen (None) ölçütler
+    devre dışıdır. NaN/inf loss her zaman ıraksama kabul edilir.
+
+    Args:
+        tolerance: Loss bu değere eşit veya altına inerse dur (mutlak tolerans)
+        relative_tolerance: Bir iyileşmenin sayılması için en iyi loss'a göre
+            gereken en küçük göreli azalma (ör. 1e-4 = %0.01)
+        patience: Sayılır bir iyileşme olmadan geçebilecek en fazla epoch sayısı;
+            verilmez ama relative_tolerance veya min_delta verilirse 1 kabul edilir
+        min_delta: Bir iyileşmenin sayılması için gereken en küçük mutlak azalma
+        time_budget: Saniye cinsinden en uzun eğitim süresi
+        divergence_factor: Loss, ilk epoch loss'unun (en az divergence_floor) bu
+            katını aşarsa ıraksama say
+        divergence_floor: Iraksama eşiğinde kullanılan en küçük referans loss; ilk
+            loss zaten çok küçükse olağan dalgalanmaların ıraksama sayılmasını önler
+    """
+
+    def __init__(self, tolerance=None, relative_tolerance=None, patience=None, min_delta=0.0,
+                 time_budget=None, divergence_factor=None, divergence_floor=1e-3):
+        self.tolerance = tolerance
+        self.relative_tolerance = relative_tolerance
+        if patience is None and (relative_tolerance is not None or min_delta > 0):
+            patience = 1
+        self.patience = patience
+        self.min_delta = min_delta
+        self.time_budget = time_budget
+        self.divergence_factor = divergence_factor
+        self.divergence_floor = divergence_floor
+        self.reset()
+
+    def reset(self):
+        """Yeni bir eğitim için durumu sıfırla ve süre ölçümünü başlat"""
+        self.start_time = time.perf_counter()
+        self.epoch = 0
+        self.first_loss = None
+        self.best_loss = math.inf
+        self.best_epoch = 0
+        self.reason = None
+        self.diverged = False
+
+    def update(self, loss):
+        """Epoch loss'unu kaydet; durdurma nedeni ya da None döndür"""
+        self.epoch += 1
+        loss = float(loss)
+
+        if not math.isfinite(loss):
+            return self.stop(f"Loss sayısal olmayan bir değere ulaştı ({loss}); eğitim ıraksadı", diverged=True)
+
+        if self.first_loss is None:
+            self.first_loss = loss
+        if self.divergence_factor is not None:
+            reference = max(abs(self.first_loss), self.divergence_floor)
+            if loss > self.divergence_factor * reference:
+                return self.stop(
+                    f"Loss {reference:.6g} referans değerinin {self.divergence_factor:g} katını aştı "
+                    f"({loss:.6g}); eğitim ıraksadı",
+                    diverged=True
+                )
+
+        if self.tolerance is not None and loss <= self.tolerance:
+            return self.stop(f"Loss hedef değere ulaştı ({loss:.6g} ≤ {self.tolerance:g})")
+
+        threshold = self.min_delta
+        if self.relative_tolerance is not None and math.isfinite(self.best_loss):
+            threshold = max(threshold, self.relative_tolerance * abs(self.best_loss))
+        if loss < self.best_loss - threshold:
+            self.best_loss = loss
+            self.best_epoch = self.epoch
+        elif self.patience is not None and self.epoch - self.best_epoch >= self.patience:
+            return self.stop(f"Son {self.patience} epoch boyunca loss iyileşmedi (en iyi: {self.best_loss:.6g})")
+
+        if self.time_budget is not None and time.perf_counter() - self.start_time >= self.time_budget:
+            return self.stop(f"Süre sınırına ulaşıldı ({self.time_budget:g} s)")
+
+        return None
+
+    def stop(self, reason, diverged=False):
+        self.reason = reason
+        self.diverged = diverged
+        return reason
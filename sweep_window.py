@@ -0,0 +1,300 @@
+import queue
+import tkinter as tk
+from tkinter import ttk, messagebox
+import ttkbootstrap as ttk
+from ttkbootstrap.constants import *
+from network_functions import ACTIVATION_FUNCTIONS, LOSS_FUNCTIONS
+from hyperparameter_sweep import SweepWorker
+from optimizers import OPTIMIZERS
+
+
+class SweepWindow(tk.Toplevel):
+    POLL_INTERVAL_MS = 100
+
+    def __init__(self, parent, network_parameters, targets):
+        super().__init__(parent)
+
+        self.parent = parent
+        self.network_parameters = network_parameters
+        self.targets = targets
+        self.worker = None
+        self.results = []
+
+        self.title("Hiperparametre Taraması")
+        self.geometry("950x700")
+        self.minsize(700, 500)
+
+        self.main_container = ttk.Frame(self)
+        self.main_container.pack(fill=BOTH, expand=YES, padx=20, pady=20)
+
+        self.main_container.grid_columnconfigure(0, weight=1)
+        self.main_container.grid_rowconfigure(2, weight=1)
+
+        self.create_grid_section()
+        self.create_progress_section()
+        self.create_results_section()
+
+        self.transient(parent)
+        self.protocol("WM_DELETE_WINDOW", self.on_closing)
+
+    def create_grid_section(self):
+        """Tarama ızgarası ayarları"""
+        frame = ttk.LabelFrame(
+            self.main_container,
+            text="Tarama Izgarası",
+            bootstyle="primary"
+        )
+        frame.grid(row=0, column=0, sticky="ew", pady=(0, 20))
+
+        frame.grid_columnconfigure(1, weight=1)
+
+        ttk.Label(
+            frame,
+            text="Learning Rate'ler:",
+            font=("Helvetica", 12)
+        ).grid(row=0, column=0, padx=(10, 10), pady=5, sticky="w")
+
+        current_lr = self.parent.lr_var.get()
+        self.lr_grid_var = tk.StringVar(value=f"{current_lr}, 0.1, 0.001")
+        ttk.Entry(
+            frame,
+            textvariable=self.lr_grid_var
+        ).grid(row=0, column=1, padx=10, pady=5, sticky="ew")
+
+        ttk.Label(
+            frame,
+            text="Epoch Sayıları:",
+            font=("Helvetica", 12)
+        ).grid(row=1, column=0, padx=(10, 10), pady=5, sticky="w")
+
+        self.epoch_grid_var = tk.StringVar(value=self.parent.epoch_var.get())
+        ttk.Entry(
+            frame,
+            textvariable=self.epoch_grid_var
+        ).grid(row=1, column=1, padx=10, pady=5, sticky="ew")
+
+        ttk.Label(
+            frame,
+            text="Aktivasyonlar:",
+            font=("Helvetica", 12)
+        ).grid(row=2, column=0, padx=(10, 10), pady=5, sticky="w")
+
+        activation_frame = ttk.Frame(frame)
+        activation_frame.grid(row=2, column=1, padx=10, pady=5, sticky="w")
+        self.activation_vars = {}
+        for name in ACTIVATION_FUNCTIONS:
+            var = tk.BooleanVar(value=True)
+            ttk.Checkbutton(activation_frame, text=name, variable=var).pack(side=LEFT, padx=(0, 10))
+            self.activation_vars[name] = var
+
+        ttk.Label(
+            frame,
+            text="Loss Fonksiyonları:",
+            font=("Helvetica", 12)
+        ).grid(row=3, column=0, padx=(10, 10), pady=5, sticky="w")
+
+        loss_frame = ttk.Frame(frame)
+        loss_frame.grid(row=3, column=1, padx=10, pady=5, sticky="w")
+        self.loss_vars = {}
+        for name in LOSS_FUNCTIONS:
+            var = tk.BooleanVar(value=True)
+            ttk.Checkbutton(loss_frame, text=name, variable=var).pack(side=LEFT, padx=(0, 10))
+            self.loss_vars[name] = var
+
+        ttk.Label(
+            frame,
+            text="Optimizer'lar:",
+            font=("Helvetica", 12)
+        ).grid(row=4, column=0, padx=(10, 10), pady=5, sticky="w")
+
+        # Varsayılan olarak yalnızca tahmin penceresinde seçili optimizer taranır
+        optimizer_frame = ttk.Frame(frame)
+        optimizer_frame.grid(row=4, column=1, padx=10, pady=5, sticky="w")
+        self.optimizer_vars = {}
+        current_optimizer = self.parent.optimizer_var.get()
+        for name in OPTIMIZERS:
+            var = tk.BooleanVar(value=name == current_optimizer)
+            ttk.Checkbutton(optimizer_frame, text=name, variable=var).pack(side=LEFT, padx=(0, 10))
+            self.optimizer_vars[name] = var
+
+        self.start_button = ttk.Button(
+            frame,
+            text="Taramayı Başlat",
+            bootstyle="success",
+            command=self.start_sweep
+        )
+        self.start_button.grid(row=5, column=0, columnspan=2, pady=10)
+
+    def create_progress_section(self):
+        """Tarama ilerleme göstergesi"""
+        frame = ttk.Frame(self.main_container)
+        frame.grid(row=1, column=0, sticky="ew", pady=(0, 10))
+        frame.grid_columnconfigure(0, weight=1)
+
+        self.progress_bar = ttk.Progressbar(frame, mode='determinate')
+        self.progress_bar.grid(row=0, column=0, sticky="ew", padx=(0, 10))
+
+        self.progress_label = ttk.Label(frame, text="", font=("Helvetica", 10))
+        self.progress_label.grid(row=0, column=1)
+
+    def create_results_section(self):
+        """Sıralı sonuç tablosu"""
+        frame = ttk.LabelFrame(
+            self.main_container,
+            text="Sonuçlar (son tahminlerin MSE değerine göre sıralı)",
+            bootstyle="primary"
+        )
+        frame.grid(row=2, column=0, sticky="nsew")
+        frame.grid_columnconfigure(0, weight=1)
+        frame.grid_rowconfigure(0, weight=1)
+
+        columns = ("rank", "activation", "loss", "optimizer", "learning_rate", "epochs", "mse", "final_loss",
+                   "wall_time")
+        headings = ("Sıra", "Aktivasyon", "Loss Fonksiyonu", "Optimizer", "Learning Rate", "Epoch", "MSE",
+                    "Son Loss", "Süre (s)")
+
+        self.results_tree = ttk.Treeview(frame, columns=columns, show="headings", height=12)
+        for column, heading in zip(columns, headings):
+            self.results_tree.heading(column, text=heading)
+            self.results_tree.column(column, width=100, anchor="center")
+        self.results_tree.grid(row=0, column=0, sticky="nsew", padx=(10, 0), pady=10)
+
+        scrollbar = ttk.Scrollbar(frame, orient="vertical", command=self.results_tree.yview)
+        scrollbar.grid(row=0, column=1, sticky="ns", padx=(0, 10), pady=10)
+        self.results_tree.configure(yscrollcommand=scrollbar.set)
+
+        button_frame = ttk.Frame(self.main_container)
+        button_frame.grid(row=3, column=0, pady=(10, 0))
+
+        ttk.Button(
+            button_frame,
+            text="Seçileni Uygula",
+            bootstyle="primary",
+            command=self.apply_selected
+        ).pack(side=LEFT, padx=5)
+
+        ttk.Button(
+            button_frame,
+            text="Kapat",
+            bootstyle="secondary-outline",
+            command=self.on_closing
+        ).pack(side=LEFT, padx=5)
+
+    def on_closing(self):
+        """Pencere kapatılırken süren taramayı iptal et"""
+        if self.worker is not None:
+            self.worker.cancel()
+            self.worker = None
+        self.destroy()
+
+    def parse_list(self, text, cast):
+        """Virgülle ayrılmış değerleri ayrıştır"""
+        return [cast(value.strip()) for value in text.split(",") if value.strip()]
+
+    def start_sweep(self):
+        """Taramayı arka planda başlat"""
+        if self.worker is not None:
+            return
+
+        try:
+            learning_rates = self.parse_list(self.lr_grid_var.get(), float)
+            epoch_counts = self.parse_list(self.epoch_grid_var.get(), int)
+        except ValueError:
+            messagebox.showerror("Hata", "Learning rate ve epoch değerleri virgülle ayrılmış sayılar olmalıdır")
+            return
+
+        if not learning_rates or any(lr <= 0 for lr in learning_rates):
+            messagebox.showerror("Hata", "Learning rate değerleri pozitif sayılar olmalıdır")
+            return
+        if not epoch_counts or any(epochs <= 0 for epochs in epoch_counts):
+            messagebox.showerror("Hata", "Epoch sayıları pozitif tam sayılar olmalıdır")
+            return
+
+        activation_names = [name for name, var in self.activation_vars.items() if var.get()]
+        loss_names = [name for name, var in self.loss_vars.items() if var.get()]
+        optimizer_names = [name for name, var in self.optimizer_vars.items() if var.get()]
+        if not activation_names or not loss_names or not optimizer_names:
+            messagebox.showerror("Hata", "En az bir aktivasyon, bir loss fonksiyonu ve bir optimizer seçilmelidir")
+            return
+
+        self.results_tree.delete(*self.results_tree.get_children())
+        self.progress_bar['value'] = 0
+        self.progress_label.configure(text="Tarama başlatılıyor...")
+        self.start_button.configure(state="disabled")
+
+        self.worker = SweepWorker(
+            self.network_parameters,
+            self.targets,
+            learning_rates,
+            epoch_counts,
+            activation_names,
+            loss_names,
+            optimizer_names
+        )
+        self.worker.start()
+        self.after(self.POLL_INTERVAL_MS, self.poll_sweep)
+
+    def poll_sweep(self):
+        """Worker kuyruğunu boşalt"""
+        if self.worker is None or not self.winfo_exists():
+            return
+
+        finished = None
+        while True:
+            try:
+                message = self.worker.messages.get_nowait()
+            except queue.Empty:
+                break
+
+            if message[0] == 'progress':
+                _, done, total = message
+                self.progress_bar['value'] = done / total * 100
+                self.progress_label.configure(text=f"{done}/{total}")
+            else:
+                finished = message
+
+        if finished is None:
+            self.after(self.POLL_INTERVAL_MS, self.poll_sweep)
+            return
+
+        self.worker = None
+        self.start_button.configure(state="normal")
+
+        if finished[0] == 'cancelled':
+            self.progress_label.configure(text="Tarama iptal edildi")
+            return
+
+        if finished[0] == 'error':
+            self.progress_label.configure(text="")
+            messagebox.showerror("Hata", f"Tarama sırasında bir hata oluştu: {finished[1]}")
+            return
+
+        self.results = finished[1]
+        self.progress_label.configure(text=f"{len(self.results)} kombinasyon tamamlandı")
+        for result in self.results:
+            self.results_tree.insert("", END, iid=str(result['rank']), values=(
+                result['rank'],
+                result['activation'],
+                result['loss'],
+                result['optimizer'],
+                f"{result['learning_rate']:g}",
+                result['epochs'],
+                f"{result['mse']:.6g}",
+                f"{result['final_loss']:.6g}",
+                f"{result['wall_time']:.3f}"
+            ))
+
+    def apply_selected(self):
+        """Seçilen kombinasyonu tahmin penceresindeki ayarlara aktar"""
+        selection = self.results_tree.selection()
+        if not selection:
+            messagebox.showinfo("Bilgi", "Lütfen tablodan bir kombinasyon seçiniz")
+            return
+
+        result = self.results[int(selection[0]) - 1]
+        self.parent.activation_var.set(result['activation'])
+        self.parent.loss_var.set(result['loss'])
+        self.parent.optimizer_var.set(result['optimizer'])
+        self.parent.lr_var.set(f"{result['learning_rate']:g}")
+        self.parent.epoch_var.set(str(result['epochs']))
+        self.on_closing()
@@ -0,0 +1,146 @@
+import queue
+import threading
+
+
+class TrainingCancelled(Exception):
+    """Eğitim kullanıcı tarafından iptal edildi; ağın epoch döngüsünü sonlandırır"""
+
+
+class PausableDataset:
+    """Worker'ın veri setini her epoch'ta iter_dataset üzerinden dolaşan sarmalayıcı"""
+
+    def __init__(self, worker):
+        self.worker = worker
+
+    def __iter__(self):
+        return self.worker.iter_dataset()
+
+
+class TrainingWorker(threading.Thread):
+    """Eğitim döngüsünü Tk ana iş parçacığı dışında çalıştıran worker
+
+    Arayüz ile yalnızca `messages` kuyruğu üzerinden haberleşir:
+        ('progress', epoch, loss, yeni_losslar, ağırlıklar) - her rapor aralığında
+        ('done', epoch, neden)                  - eğitim tamamlandı (erken durduysa
+                                                  neden metni, aksi halde None)
+        ('cancelled', epoch)                    - eğitim iptal edildi
+        ('error', mesaj)                        - eğitim sırasında hata oluştu
+
+    `yeni_losslar` bir önceki rapordan bu yana hesaplanan loss değerleridir;
+    arayüz bunları kendi loss geçmişine ekler. `ağırlıklar`, snapshot_weights
+    açıksa o anki ağırlıkların kopyasıdır (canlı görselleştirme için), değilse None.
+
+    stopping (StoppingCriteria) verilirse her epoch loss'u ölçütlere verilir ve
+    eğitim erken durabilir; stopping.diverged ıraksamayı belirtir. schedule
+    (learning rate planı) verilirse learning rate her epoch sonunda güncellenir.
+
+    dataset verilirse her epoch tek örnek yerine veri setinin tüm parçaları
+    üzerinde eğitilir; duraklatma ve iptal parçalar arasında da uygulanır.
+
+    Eğitim ağın train / train_stream döngüsüyle yapılır (CLI ile aynı döngü);
+    worker bu döngüye epoch sonu callback'i olarak bağlanır.
+    """
+
+    def __init__(self, network, inputs, targets, epochs, report_interval=None, dataset=None,
+                 snapshot_weights=False, stopping=None, schedule=None):
+        super().__init__(daemon=True)
+        self.network = network
+        self.inputs = inputs
+        self.targets = targets
+        self.dataset = dataset
+        self.epochs = epochs
+        self.report_interval = report_interval or max(1, epochs // 100)
+        self.snapshot_weights = snapshot_weights
+        self.stopping = stopping
+        self.schedule = schedule
+        self.messages = queue.Queue()
+        self.pending_losses = []
+        self.completed_epochs = 0
+
+        self._cancel_event = threading.Event()
+        self._resume_event = threading.Event()
+        self._resume_event.set()
+
+    def run(self):
+        self.pending_losses = []
+        self.completed_epochs = 0
+        try:
+            # Epoch döngüsü, durma ölçütleri ve learning rate planı ağın kendi
+            # train / train_stream döngüsündedir; worker yalnızca epoch sonlarında
+            # rapor verir, duraklar ve iptal durumunu kontrol eder.
+            self.wait_if_paused()
+            if self.dataset is not None:
+                self.network.train_stream(PausableDataset(self), self.epochs, stopping=self.stopping,
+                                          schedule=self.schedule, callback=self.on_epoch_end)
+            else:
+                self.network.train(self.inputs, self.targets, self.epochs, stopping=self.stopping,
+                                   schedule=self.schedule, callback=self.on_epoch_end)
+
+        except TrainingCancelled:
+            # Yarıda kesilen epoch'un loss değeri kaydedilmez
+            self.report_cancel(self.completed_epochs, self.pending_losses)
+            return
+        except Exception as e:
+            self.messages.put(('error', str(e)))
+            return
+
+        self.messages.put(('done', self.completed_epochs, self.network.stop_reason))
+
+    def on_epoch_end(self, epoch, loss, learning_rate):
+        """Ağın epoch döngüsünden her epoch sonunda çağrılır"""
+        loss = float(loss)
+        self.pending_losses.append(loss)
+        self.completed_epochs = epoch + 1
+        stopped = self.network.stop_reason is not None
+        last_epoch = epoch == self.epochs - 1
+        if epoch % self.report_interval == 0 or last_epoch or stopped:
+            self.messages.put(('progress', epoch + 1, loss, self.pending_losses, self.weights_snapshot()))
+            self.pending_losses = []
+        if not (last_epoch or stopped):
+            self.wait_if_paused()
+
+    def wait_if_paused(self):
+        """Duraklatılmışsa devam edilene kadar bekle; iptal edildiyse TrainingCancelled fırlat"""
+        self._resume_event.wait()
+        if self._cancel_event.is_set():
+            raise TrainingCancelled()
+
+    def report_cancel(self, epoch, pending_losses):
+        """Bekleyen loss değerlerini ve iptal bilgisini gönder"""
+        self.messages.put(('progress', epoch, pending_losses[-1] if pending_losses else None, pending_losses, None))
+        self.messages.put(('cancelled', epoch))
+
+    def weights_snapshot(self):
+        """Arayüz thread'inin güvenle okuyabileceği ağırlık kopyaları"""
+        if not self.snapshot_weights:
+            return None
+        return [weight.copy() for weight in self.network.weights]
+
+    def iter_dataset(self):
+        """Veri seti parçalarını duraklatma/iptal durumunu gözeterek üret"""
+        chunks = iter(self.dataset)
+        try:
+            for chunk in chunks:
+                self.wait_if_paused()
+                yield chunk
+        finally:
+            close = getattr(chunks, 'close', None)
+            if close is not None:
+                close()
+
+    def pause(self):
+        """Eğitimi bir sonraki epoch başında duraklat"""
+        self._resume_event.clear()
+
+    def resume(self):
+        """Duraklatılmış eğitime devam et"""
+        self._resume_event.set()
+
+    def cancel(self):
+        """Eğitimi iptal et (duraklatılmışsa da sonlanır)"""
+        self._cancel_event.set()
+        self._resume_event.set()
+
+    @property
+    def paused(self):
+        return not self._resume_event.is_set()